@@ -7,6 +7,13 @@ from PyQt6.QtWidgets import (
     QGroupBox,
 )
 
+_TOOLTIPS = {
+    "filter": "Filter messages using a powerful expression.\nSee tdl documentation for syntax.",
+    "contains_term": "Adds a quick filter that keeps messages whose text contains the given hashtag or term.",
+    "reply": "Only export messages that are replies to this specific message ID.",
+    "topic": "For groups with Topics enabled, export messages from a specific topic ID.",
+}
+
 
 class AdvancedExportDialog(QDialog):
     def __init__(self, parent=None):
@@ -14,7 +21,17 @@ class AdvancedExportDialog(QDialog):
         self.setWindowTitle("Advanced Export Options")
         self.setMinimumWidth(500)
 
-        self._init_ui()
+        # Widgets are built on first show (or first settings access).
+        self._built = False
+
+    def showEvent(self, event):
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        if not self._built:
+            self._built = True
+            self._init_ui()
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -24,31 +41,23 @@ class AdvancedExportDialog(QDialog):
 
         self.export_filter_input = QLineEdit()
         self.export_filter_input.setPlaceholderText("e.g., IsPhoto && HasViews")
-        self.export_filter_input.setToolTip(
-            "Filter messages using a powerful expression.\nSee tdl documentation for syntax."
-        )
+        self.export_filter_input.setToolTip(_TOOLTIPS["filter"])
 
         self.contains_term_input = QLineEdit()
         self.contains_term_input.setPlaceholderText("e.g., #hashtag or keyword")
-        self.contains_term_input.setToolTip(
-            "Adds a quick filter that keeps messages whose text contains the given hashtag or term."
-        )
+        self.contains_term_input.setToolTip(_TOOLTIPS["contains_term"])
 
         self.export_reply_input = QLineEdit()
         self.export_reply_input.setPlaceholderText(
             "Export replies to a specific message ID"
         )
-        self.export_reply_input.setToolTip(
-            "Only export messages that are replies to this specific message ID."
-        )
+        self.export_reply_input.setToolTip(_TOOLTIPS["reply"])
 
         self.export_topic_input = QLineEdit()
         self.export_topic_input.setPlaceholderText(
             "Export from a specific topic/forum ID"
         )
-        self.export_topic_input.setToolTip(
-            "For groups with Topics enabled, export messages from a specific topic ID."
-        )
+        self.export_topic_input.setToolTip(_TOOLTIPS["topic"])
 
         form_layout.addRow("Filter Expression:", self.export_filter_input)
         form_layout.addRow("Contains Term:", self.contains_term_input)
@@ -66,6 +75,7 @@ class AdvancedExportDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def get_settings(self):
+        self._ensure_ui()
         return {
             "filter": self.export_filter_input.text(),
             "contains_term": self.contains_term_input.text(),
@@ -77,6 +87,7 @@ class AdvancedExportDialog(QDialog):
         if not settings:
             return
 
+        self._ensure_ui()
         self.export_filter_input.setText(settings.get("filter", ""))
         self.contains_term_input.setText(settings.get("contains_term", ""))
         self.export_reply_input.setText(settings.get("reply", ""))
@@ -2,7 +2,8 @@ import webbrowser
 import json
 import tempfile
 import os
-from PyQt6.QtCore import QUrl, QStringListModel, Qt
+from functools import partial
+from PyQt6.QtCore import QUrl, QStringListModel, Qt, QEvent, QTimer, QSignalBlocker
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -27,13 +28,64 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QAction, QTextCursor
-from src.expr_syntax_highlighter import ExprSyntaxHighlighter
+from src.expr_syntax_highlighter import CachedExprSyntaxHighlighter
+
+_EXPR_KEYWORDS = (
+    "let", "in", "and", "or", "not", "matches", "true", "false", "nil",
+    "trim", "trimPrefix", "trimSuffix", "upper", "lower", "split",
+    "splitAfter", "replace", "repeat", "indexOf", "lastIndexOf",
+    "hasPrefix", "hasSuffix", "now", "duration", "date", "timezone",
+    "max", "min", "abs", "ceil", "floor", "round", "all", "any", "one",
+    "none", "map", "filter", "find", "findIndex", "findLast",
+    "findLastIndex", "groupBy", "count", "concat", "flatten", "uniq",
+    "join", "reduce", "sum", "mean", "median", "first", "last", "take",
+    "reverse", "sort", "sortBy", "keys", "values", "type", "int",
+    "float", "string", "toJSON", "fromJSON", "toBase64", "fromBase64",
+    "toPairs", "fromPairs", "len", "get", "bitand", "bitor", "bitxor",
+    "bitnand", "bitnot", "bitshl", "bitshr", "bitushr",
+    "Message", "From",
+)
+_MESSAGE_FIELDS = ("Message", "Date", "Views", "ID")
+_FROM_FIELDS = ("VisibleName", "ID")
+# Completion lists offered after "<prefix>.", keyed by the lowercased prefix.
+_FIELD_LISTS = {"message": _MESSAGE_FIELDS, "from": _FROM_FIELDS}
+
+_PLACEHOLDERS = (
+    "Message.Message",
+    "From.VisibleName",
+    "From.ID",
+    "Message.Date",
+    "Message.Views",
+)
+_FORWARD_MODES = ("direct", "clone")
+
+_TOOLTIPS = {
+    "mode": "Direct: Official forward with header.\nClone: Copy content without header (may not work for all message types).",
+    "dry_run": "Activates the --dry-run flag.",
+    "silent": "Activates the --silent flag.",
+    "no_group": "Activates the --single flag.",
+    "desc_order": "Activates the --desc flag.",
+    "edit_expression": "Write your `expr` expression here. Press Ctrl+Space for autocompletion.",
+    "load_preset": "Load a previously saved expression preset.",
+    "save_preset": "Save the current expression as a preset for later use.",
+}
+
+_EXAMPLE_EXPRS = (
+    ("Append Text", 'Message.Message + "\n-- Appended Text"'),
+    ("Prepend Text", '"Prepended Text --\n" + Message.Message'),
+    ("Add Sender Name", '`Forwarded from: ${From.VisibleName}\n\n${Message.Message}`'),
+    ("Convert to Uppercase", "upper(Message.Message)"),
+    ("Replace Words", 'replace(Message.Message, "old", "new")'),
+)
 
 
 class PresetMenuItem(QWidget):
     """A custom widget for an item in the preset menu."""
     clicked = pyqtSignal()
 
+    # Shared by every preset row; fetched from the style on first use.
+    _close_icon = None
+
     def __init__(self, name, parent=None):
         super().__init__(parent)
         self.name = name
@@ -46,8 +98,11 @@ class PresetMenuItem(QWidget):
 
         self.delete_button = QPushButton()
         self.delete_button.setObjectName("PresetDeleteButton")
-        icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCloseButton)
-        self.delete_button.setIcon(icon)
+        if PresetMenuItem._close_icon is None:
+            PresetMenuItem._close_icon = self.style().standardIcon(
+                QStyle.StandardPixmap.SP_DialogCloseButton
+            )
+        self.delete_button.setIcon(PresetMenuItem._close_icon)
         self.delete_button.setFixedSize(20, 20)
         self.delete_button.setFlat(True)
         self.delete_button.setToolTip(f"Delete preset '{name}'")
@@ -55,7 +110,6 @@ class PresetMenuItem(QWidget):
         layout.addWidget(self.name_label)
         layout.addStretch()
         layout.addWidget(self.delete_button)
-        self.setLayout(layout)
 
     def mouseReleaseEvent(self, event):
         # Emit the clicked signal only if the click was not on the delete button
@@ -75,6 +129,33 @@ class AdvancedForwardDialog(QDialog):
         self.setObjectName("AdvancedForwardDialog")
         self.setMinimumWidth(600)
 
+        # Widgets are built on first show (or first settings access).
+        self._built = False
+        self._editor_helpers_attached = False
+        self._example_menu = None
+        self._preset_menu = None
+        self._preset_menu_key = None
+        # Reused across saves/deletes rather than rebuilt each time.
+        self._save_preset_dialog = None
+        self._delete_preset_box = None
+
+        # Preset edits are kept in memory and written back in one debounced save.
+        self._presets_cache = None
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_presets)
+
+    def showEvent(self, event):
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        if not self._built:
+            self._built = True
+            self._init_ui()
+
+    def _init_ui(self):
         layout = QVBoxLayout(self)
 
         # Edit Message Tabs
@@ -93,28 +174,28 @@ class AdvancedForwardDialog(QDialog):
         options_layout = QFormLayout(options_group)
 
         self.mode_selector = QComboBox()
-        self.mode_selector.addItems(["direct", "clone"])
-        self.mode_selector.setToolTip(
-            "Direct: Official forward with header.\nClone: Copy content without header (may not work for all message types)."
+        self.mode_selector.setModel(
+            QStringListModel(list(_FORWARD_MODES), self.mode_selector)
         )
+        self.mode_selector.setToolTip(_TOOLTIPS["mode"])
         options_layout.addRow("Forwarding Mode:", self.mode_selector)
 
         self.dry_run_checkbox = QCheckBox("Dry run (don't actually forward, just log)")
-        self.dry_run_checkbox.setToolTip("Activates the --dry-run flag.")
+        self.dry_run_checkbox.setToolTip(_TOOLTIPS["dry_run"])
         options_layout.addRow(self.dry_run_checkbox)
 
         self.silent_checkbox = QCheckBox("Silent forward (no notification)")
-        self.silent_checkbox.setToolTip("Activates the --silent flag.")
+        self.silent_checkbox.setToolTip(_TOOLTIPS["silent"])
         options_layout.addRow(self.silent_checkbox)
 
         self.no_group_checkbox = QCheckBox(
             "Disable grouped detection (forward album as single messages)"
         )
-        self.no_group_checkbox.setToolTip("Activates the --single flag.")
+        self.no_group_checkbox.setToolTip(_TOOLTIPS["no_group"])
         options_layout.addRow(self.no_group_checkbox)
 
         self.desc_order_checkbox = QCheckBox("Forward in descending order")
-        self.desc_order_checkbox.setToolTip("Activates the --desc flag.")
+        self.desc_order_checkbox.setToolTip(_TOOLTIPS["desc_order"])
         options_layout.addRow(self.desc_order_checkbox)
 
         # Dialog buttons
@@ -154,17 +235,12 @@ class AdvancedForwardDialog(QDialog):
         self.edit_input.setPlaceholderText(
             '# Example: Prepend sender name and append a signature\n`Forwarded from: ${From.VisibleName}\n\n${Message.Message}\n\n--\nSent via TDL-GUI`'
         )
-        self.edit_input.setToolTip("Write your `expr` expression here. Press Ctrl+Space for autocompletion.")
-        self.highlighter = ExprSyntaxHighlighter(self.edit_input.document())
-
-        # Setup completer
-        self.completer = QCompleter(self)
-        self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.completer.setWidget(self.edit_input)
-        self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-
-        self._update_completer_model("")
-        self.edit_input.textChanged.connect(self._update_completer_model_on_text_change)
+        self.edit_input.setToolTip(_TOOLTIPS["edit_expression"])
+        # The highlighter and completer are attached on first focus, since
+        # many users never open the Advanced Editor tab.
+        self.highlighter = None
+        self.completer = None
+        self.edit_input.installEventFilter(self)
 
         top_layout.addWidget(self.edit_input)
 
@@ -172,13 +248,9 @@ class AdvancedForwardDialog(QDialog):
         button_v_layout = QVBoxLayout()
 
         self.placeholder_combo = QComboBox()
-        self.placeholder_combo.addItems([
-            "Message.Message",
-            "From.VisibleName",
-            "From.ID",
-            "Message.Date",
-            "Message.Views",
-        ])
+        self.placeholder_combo.setModel(
+            QStringListModel(list(_PLACEHOLDERS), self.placeholder_combo)
+        )
         insert_placeholder_button = QPushButton("Insert Placeholder")
         insert_placeholder_button.clicked.connect(self._insert_placeholder_from_combo)
 
@@ -197,10 +269,10 @@ class AdvancedForwardDialog(QDialog):
 
         # Bottom part with buttons
         self.load_preset_button = QPushButton("Load Preset")
-        self.load_preset_button.setToolTip("Load a previously saved expression preset.")
+        self.load_preset_button.setToolTip(_TOOLTIPS["load_preset"])
         self.load_preset_button.clicked.connect(self._on_load_preset)
         self.save_preset_button = QPushButton("Save Preset")
-        self.save_preset_button.setToolTip("Save the current expression as a preset for later use.")
+        self.save_preset_button.setToolTip(_TOOLTIPS["save_preset"])
         self.save_preset_button.clicked.connect(self._on_save_preset)
 
         bottom_button_layout = QHBoxLayout()
@@ -218,81 +290,89 @@ class AdvancedForwardDialog(QDialog):
         main_edit_layout.addWidget(doc_label)
         layout.addWidget(group)
 
-    def _insert_placeholder_from_combo(self):
-        self.edit_input.insertPlainText(self.placeholder_combo.currentText())
+    def eventFilter(self, obj, event):
+        if (
+            obj is self.edit_input
+            and event.type() == QEvent.Type.FocusIn
+            and not self._editor_helpers_attached
+        ):
+            self._attach_editor_helpers()
+        return super().eventFilter(obj, event)
 
-    def _create_example_menu(self):
-        menu = QMenu(self)
-        examples = {
-            "Append Text": 'Message.Message + "\n-- Appended Text"',
-            "Prepend Text": '"Prepended Text --\n" + Message.Message',
-            "Add Sender Name": '`Forwarded from: ${From.VisibleName}\n\n${Message.Message}`',
-            "Convert to Uppercase": "upper(Message.Message)",
-            "Replace Words": 'replace(Message.Message, "old", "new")',
+    def _attach_editor_helpers(self):
+        self._editor_helpers_attached = True
+        self.edit_input.removeEventFilter(self)
+        self.highlighter = CachedExprSyntaxHighlighter(self.edit_input.document())
+
+        # Setup completer
+        self.completer = QCompleter(self)
+        self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.completer.setWidget(self.edit_input)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+
+        # Completion models are built once and swapped in as the context changes.
+        self._default_model = QStringListModel(list(_EXPR_KEYWORDS), self)
+        self._field_models = {
+            prefix: QStringListModel(list(fields), self)
+            for prefix, fields in _FIELD_LISTS.items()
         }
-        for text, expr in examples.items():
-            action = QAction(text, self)
-            action.triggered.connect(lambda checked, content=expr: self._insert_example(content))
-            menu.addAction(action)
-        return menu
 
-    def _insert_example(self, text):
-        self.edit_input.setPlainText(text)
+        self._update_completer_model("")
 
-    def _generate_simple_expression(self):
-        parts = []
-        prepend_text = self.prepend_text_input.toPlainText().strip()
-        append_text = self.append_text_input.toPlainText().strip()
+        # Collapse bursts of keystrokes into a single completer refresh.
+        self._completer_timer = QTimer(self)
+        self._completer_timer.setSingleShot(True)
+        self._completer_timer.setInterval(80)
+        self._completer_timer.timeout.connect(self._do_update_completer_model)
+        self.edit_input.textChanged.connect(self._completer_timer.start)
 
-        if self.include_sender_checkbox.isChecked():
-            parts.append('From.VisibleName + ":\\n"')
+    def _insert_placeholder_from_combo(self):
+        with QSignalBlocker(self.edit_input):
+            self.edit_input.insertPlainText(self.placeholder_combo.currentText())
+        self._schedule_completer_update()
 
-        if prepend_text:
-            parts.append(f'"{prepend_text}\\n"')
+    def _schedule_completer_update(self):
+        # Programmatic edits block textChanged; refresh the completer once afterwards.
+        if self._editor_helpers_attached:
+            self._completer_timer.start()
 
-        if self.include_original_msg_checkbox.isChecked():
-            parts.append("Message.Message")
+    def _create_example_menu(self):
+        if self._example_menu is None:
+            self._example_menu = QMenu(self)
+            for text, expr in _EXAMPLE_EXPRS:
+                action = QAction(text, self)
+                action.triggered.connect(partial(self._insert_example, expr))
+                self._example_menu.addAction(action)
+        return self._example_menu
+
+    def _insert_example(self, text, checked=False):
+        with QSignalBlocker(self.edit_input):
+            self.edit_input.setPlainText(text)
+        self._schedule_completer_update()
 
-        if append_text:
-            parts.append(f'"\\n{append_text}"')
+    def _generate_simple_expression(self):
+        prepend_text = self.prepend_text_input.toPlainText().strip()
+        append_text = self.append_text_input.toPlainText().strip()
+
+        sender = 'From.VisibleName + ":\\n"' if self.include_sender_checkbox.isChecked() else ""
+        prepend = f'"{prepend_text}\\n"' if prepend_text else ""
+        original = "Message.Message" if self.include_original_msg_checkbox.isChecked() else ""
+        append = f'"\\n{append_text}"' if append_text else ""
 
-        return " + ".join(parts) if parts else ""
+        return " + ".join(filter(None, (sender, prepend, original, append)))
 
-    def _update_completer_model_on_text_change(self):
+    def _do_update_completer_model(self):
         cursor = self.edit_input.textCursor()
         cursor.select(QTextCursor.SelectionType.WordUnderCursor)
         word = cursor.selectedText()
 
-        if '.' in word:
-            base = word.split('.')[0]
-            self._update_completer_model(base)
-        else:
-            self._update_completer_model("")
+        head, sep, _ = word.partition('.')
+        self._update_completer_model(head if sep else "")
 
     def _update_completer_model(self, prefix):
-        if prefix.lower() == "message":
-            word_list = ["Message", "Date", "Views", "ID"]
-        elif prefix.lower() == "from":
-            word_list = ["VisibleName", "ID"]
-        else:
-            word_list = [
-                "let", "in", "and", "or", "not", "matches", "true", "false", "nil",
-                "trim", "trimPrefix", "trimSuffix", "upper", "lower", "split",
-                "splitAfter", "replace", "repeat", "indexOf", "lastIndexOf",
-                "hasPrefix", "hasSuffix", "now", "duration", "date", "timezone",
-                "max", "min", "abs", "ceil", "floor", "round", "all", "any", "one",
-                "none", "map", "filter", "find", "findIndex", "findLast",
-                "findLastIndex", "groupBy", "count", "concat", "flatten", "uniq",
-                "join", "reduce", "sum", "mean", "median", "first", "last", "take",
-                "reverse", "sort", "sortBy", "keys", "values", "type", "int",
-                "float", "string", "toJSON", "fromJSON", "toBase64", "fromBase64",
-                "toPairs", "fromPairs", "len", "get", "bitand", "bitor", "bitxor",
-                "bitnand", "bitnot", "bitshl", "bitshr", "bitushr",
-                "Message", "From"
-            ]
-
-        model = QStringListModel(word_list, self)
-        self.completer.setModel(model)
+        self.completer.setModel(
+            self._field_models.get(prefix.lower(), self._default_model)
+        )
 
     def _on_save_preset(self):
         expression = self.edit_input.toPlainText().strip()
@@ -300,67 +380,105 @@ class AdvancedForwardDialog(QDialog):
             self.logger.warning("Preset is empty, not saving.")
             return
 
-        preset_name, ok = QInputDialog.getText(
-            self, "Save Preset", "Enter a name for the preset:"
-        )
+        if self._save_preset_dialog is None:
+            self._save_preset_dialog = QInputDialog(self)
+            self._save_preset_dialog.setWindowTitle("Save Preset")
+            self._save_preset_dialog.setLabelText("Enter a name for the preset:")
+        self._save_preset_dialog.setTextValue("")
+        ok = self._save_preset_dialog.exec()
+        preset_name = self._save_preset_dialog.textValue()
 
         if ok and preset_name:
-            presets = self.settings_manager.get("presets", {})
-            presets[preset_name] = expression
-            self.settings_manager.set("presets", presets)
-            self.settings_manager.save_settings()
+            self._get_presets()[preset_name] = expression
+            self._save_timer.start()
+            self._preset_menu_key = None
             self.logger.info(f"Saved preset '{preset_name}'.")
 
+    def _get_presets(self):
+        if self._presets_cache is None:
+            self._presets_cache = dict(self.settings_manager.get("presets", {}))
+        return self._presets_cache
+
+    def _flush_presets(self):
+        self._save_timer.stop()
+        self.settings_manager.set("presets", self._presets_cache)
+        self.settings_manager.save_settings()
+
+    def done(self, result):
+        if self._save_timer.isActive():
+            self._flush_presets()
+        super().done(result)
+
     def _on_load_preset(self):
-        presets = self.settings_manager.get("presets", {})
+        presets = self._get_presets()
+        key = tuple(sorted(presets.items()))
+        if self._preset_menu is None or key != self._preset_menu_key:
+            if self._preset_menu is not None:
+                self._preset_menu.deleteLater()
+            self._preset_menu = self._build_preset_menu(presets)
+            self._preset_menu_key = key
+
         if not presets:
             self.logger.info("No saved presets found.")
+        self._preset_menu.exec(self.load_preset_button.mapToGlobal(self.load_preset_button.rect().bottomLeft()))
+
+    def _build_preset_menu(self, presets):
+        menu = QMenu(self)
+        if not presets:
             # Optionally, show a disabled menu item
-            menu = QMenu(self)
-            action = QAction("No Saved Presets", self)
+            action = QAction("No Saved Presets", menu)
             action.setEnabled(False)
             menu.addAction(action)
-            menu.exec(self.load_preset_button.mapToGlobal(self.load_preset_button.rect().bottomLeft()))
-            return
+            return menu
 
-        menu = QMenu(self)
         for name, expression in presets.items():
             widget_action = self._create_preset_widget(name, expression, menu)
             menu.addAction(widget_action)
-
-        menu.exec(self.load_preset_button.mapToGlobal(self.load_preset_button.rect().bottomLeft()))
+        return menu
 
     def _create_preset_widget(self, name, expression, menu):
         menu_item = PresetMenuItem(name)
 
         # Connect the custom signals to the desired actions
-        menu_item.clicked.connect(lambda: (self.edit_input.setPlainText(expression), menu.close()))
-        menu_item.delete_button.clicked.connect(lambda: self._on_delete_preset(name, menu))
+        menu_item.clicked.connect(partial(self._load_preset_expression, expression, menu))
+        menu_item.delete_button.clicked.connect(partial(self._on_delete_preset, name, menu))
 
-        widget_action = QWidgetAction(self)
+        widget_action = QWidgetAction(menu)
         widget_action.setDefaultWidget(menu_item)
         return widget_action
 
-    def _on_delete_preset(self, name, menu):
-        reply = QMessageBox.question(
-            self,
-            "Confirm Delete",
-            f"Are you sure you want to delete the preset '{name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
+    def _load_preset_expression(self, expression, menu):
+        with QSignalBlocker(self.edit_input):
+            self.edit_input.setPlainText(expression)
+        self._schedule_completer_update()
+        menu.close()
+
+    def _on_delete_preset(self, name, menu, checked=False):
+        if self._delete_preset_box is None:
+            self._delete_preset_box = QMessageBox(self)
+            self._delete_preset_box.setIcon(QMessageBox.Icon.Question)
+            self._delete_preset_box.setWindowTitle("Confirm Delete")
+            self._delete_preset_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+        self._delete_preset_box.setDefaultButton(QMessageBox.StandardButton.No)
+        self._delete_preset_box.setText(
+            f"Are you sure you want to delete the preset '{name}'?"
         )
+        reply = self._delete_preset_box.exec()
 
         if reply == QMessageBox.StandardButton.Yes:
-            presets = self.settings_manager.get("presets", {})
+            presets = self._get_presets()
             if name in presets:
                 del presets[name]
-                self.settings_manager.set("presets", presets)
-                self.settings_manager.save_settings()
+                self._save_timer.start()
+                self._preset_menu_key = None
                 self.logger.info(f"Deleted preset '{name}'.")
             menu.close()
 
     def get_settings(self):
         """Returns a dictionary of the selected settings."""
+        self._ensure_ui()
         edit_expression = ""
         if self.tabs.currentWidget() == self.simple_editor_tab:
             edit_expression = self._generate_simple_expression()
@@ -12,12 +12,222 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QToolButton,
     QGroupBox,
+    QGridLayout,
+    QLabel,
 )
+from dataclasses import dataclass
 from functools import partial
-from PyQt6.QtCore import Qt, QUrl
-from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtCore import Qt, QUrl, QStringListModel, QSignalBlocker, pyqtSlot
+from PyQt6.QtGui import QDesktopServices, QIcon, QPixmapCache
 from PyQt6.QtWidgets import QAbstractSpinBox, QStyle
 
+_help_icon = None
+_HELP_ICON_KEY = "tdlgui:help"
+_HELP_ICON_SIZE = 16
+
+
+def _get_help_icon(style):
+    """
+    Returns the shared question-mark icon. Its pixmap is rendered by the style
+    once and kept in QPixmapCache so other widgets can share the pixel data.
+    """
+    global _help_icon
+    if _help_icon is None:
+        pixmap = QPixmapCache.find(_HELP_ICON_KEY)
+        if pixmap is None:
+            pixmap = style.standardIcon(
+                QStyle.StandardPixmap.SP_MessageBoxQuestion
+            ).pixmap(_HELP_ICON_SIZE, _HELP_ICON_SIZE)
+            QPixmapCache.insert(_HELP_ICON_KEY, pixmap)
+        _help_icon = QIcon(pixmap)
+    return _help_icon
+
+
+_TOOLTIPS = {
+    "concurrent_tasks": "Set the maximum number of files to download at the same time.",
+    "threads_per_task": "Set the maximum number of parallel connections for a single file.",
+    "pool_size": "Advanced: The size of the DC pool for the Telegram client.\nLeave at 8 unless you have connection issues.",
+    "delay": "Wait a specified amount of time between download tasks to avoid API rate limits.",
+    "desc_order": "Download files from newest to oldest instead of the default (oldest to newest).",
+    "skip_same": "If a file with the same name and size already exists in the destination, skip it.",
+    "rewrite_ext": "Renames the file extension based on its actual content type (MIME type).",
+    "group_albums": "If a message link points to a file in an album, download all other files in that album automatically.",
+    "use_takeout": "Use a special session type that is less prone to API rate limits.\nUseful for very large downloads.",
+    "include_exts": "Only download files with these extensions. Cannot be used with Exclude.",
+    "exclude_exts": "Do not download files with these extensions. Cannot be used with Include.",
+}
+
+# Declarative field specs used to build the dialog's repetitive rows.
+# (attribute, label, minimum, maximum, default, tooltip)
+_CONCURRENCY_FIELDS = (
+    (
+        "concurrent_tasks_spinbox",
+        "Concurrent Tasks:",
+        1,
+        16,
+        2,
+        _TOOLTIPS["concurrent_tasks"],
+    ),
+    (
+        "threads_per_task_spinbox",
+        "Threads per Task:",
+        1,
+        16,
+        4,
+        _TOOLTIPS["threads_per_task"],
+    ),
+)
+_CONNECTION_FIELDS = (
+    (
+        "pool_spinbox",
+        "DC Pool Size:",
+        0,
+        100,
+        8,
+        _TOOLTIPS["pool_size"],
+    ),
+)
+# (attribute, text, checked, tooltip)
+_FLAG_FIELDS = (
+    (
+        "desc_checkbox",
+        "Download in descending order",
+        False,
+        _TOOLTIPS["desc_order"],
+    ),
+    (
+        "skip_same_checkbox",
+        "Skip identical files",
+        True,
+        _TOOLTIPS["skip_same"],
+    ),
+    (
+        "rewrite_ext_checkbox",
+        "Rewrite file extension",
+        False,
+        _TOOLTIPS["rewrite_ext"],
+    ),
+    (
+        "group_checkbox",
+        "Auto-download albums/groups",
+        False,
+        _TOOLTIPS["group_albums"],
+    ),
+    (
+        "takeout_checkbox",
+        "Use takeout session (lowers limits)",
+        False,
+        _TOOLTIPS["use_takeout"],
+    ),
+)
+_DELAY_UNITS = ("ms", "s", "m")
+_DEFAULT_TEMPLATE_LABEL = (
+    "Default: {{ .DialogID }}_{{ .MessageID }}_{{ filenamify .FileName }}"
+)
+_DEFAULT_TEMPLATE_VALUE = _DEFAULT_TEMPLATE_LABEL.removeprefix("Default: ")
+_CUSTOM_TEMPLATE_LABEL = "Custom..."
+_TEMPLATE_HELP_URL = QUrl("https://docs.iyear.me/tdl/guide/template/")
+_TEMPLATE_CHOICES = (
+    _DEFAULT_TEMPLATE_LABEL,
+    "{{ .DialogID }}/{{ .FileName }}",
+    "{{ .MessageID }}-{{ .FileName }}",
+    "{{ .FileName }}",
+    _CUSTOM_TEMPLATE_LABEL,
+)
+_TEMPLATE_PLACEHOLDERS = (
+    "FileName",
+    "MessageID",
+    "DialogID",
+    "FileSize",
+    "Ext",
+    "Date",
+    "Time",
+)
+_FILTERS_TAB_INDEX = 1
+_FILTERS_TAB_TITLE = "Filters & Naming"
+
+# (attribute, label, placeholder, tooltip)
+_FILTER_FIELDS = (
+    (
+        "include_ext_input",
+        "Include Exts:",
+        "e.g., mp4,mkv,zip",
+        _TOOLTIPS["include_exts"],
+    ),
+    (
+        "exclude_ext_input",
+        "Exclude Exts:",
+        "e.g., jpg,png,gif",
+        _TOOLTIPS["exclude_exts"],
+    ),
+)
+
+
+_UP_ARROW = Qt.ArrowType.UpArrow
+_DOWN_ARROW = Qt.ArrowType.DownArrow
+_NO_BUTTONS = QAbstractSpinBox.ButtonSymbols.NoButtons
+
+
+def make_spinbox_with_arrows(min_val, max_val, default_val):
+    """Returns (container, spinbox) for a spinbox with external arrow buttons."""
+    container = QWidget()
+    layout = QHBoxLayout(container)
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(2)
+
+    spinbox = QSpinBox()
+    spinbox.setRange(min_val, max_val)
+    spinbox.setValue(default_val)
+    spinbox.setButtonSymbols(_NO_BUTTONS)
+
+    up_button = QToolButton()
+    up_button.setArrowType(_UP_ARROW)
+    up_button.clicked.connect(spinbox.stepUp)
+    down_button = QToolButton()
+    down_button.setArrowType(_DOWN_ARROW)
+    down_button.clicked.connect(spinbox.stepDown)
+
+    layout.addWidget(spinbox, 1)
+    layout.addWidget(down_button)
+    layout.addWidget(up_button)
+    return container, spinbox
+
+
+@dataclass(frozen=True)
+class DownloadSettings:
+    """Immutable snapshot of the options chosen in AdvancedSettingsDialog."""
+
+    # Declared by hand rather than with slots=True, which needs Python 3.10.
+    __slots__ = (
+        "concurrent_tasks",
+        "threads_per_task",
+        "pool_size",
+        "delay",
+        "delay_unit",
+        "desc_order",
+        "skip_same",
+        "rewrite_ext",
+        "group_albums",
+        "use_takeout",
+        "include_exts",
+        "exclude_exts",
+        "template",
+    )
+
+    concurrent_tasks: int
+    threads_per_task: int
+    pool_size: int
+    delay: int
+    delay_unit: str
+    desc_order: bool
+    skip_same: bool
+    rewrite_ext: bool
+    group_albums: bool
+    use_takeout: bool
+    include_exts: str
+    exclude_exts: str
+    template: str
+
 
 class AdvancedSettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -25,17 +235,34 @@ class AdvancedSettingsDialog(QDialog):
         self.setWindowTitle("Advanced Download Options")
         self.setMinimumWidth(600)
 
-        self._init_ui()
+        # Widgets are built on first show (or first settings access).
+        self._built = False
+
+    def showEvent(self, event):
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        if not self._built:
+            self._built = True
+            # Suppress intermediate relayouts while the widget tree is assembled.
+            self.setUpdatesEnabled(False)
+            try:
+                self._init_ui()
+            finally:
+                self.setUpdatesEnabled(True)
 
     def _init_ui(self):
         layout = QVBoxLayout(self)
 
         self.tabs = QTabWidget()
         self.general_tab = self._create_general_tab()
-        self.filters_naming_tab = self._create_filters_naming_tab()
+        # The Filters & Naming tab is built the first time it is shown.
+        self.filters_naming_tab = None
 
         self.tabs.addTab(self.general_tab, "General")
-        self.tabs.addTab(self.filters_naming_tab, "Filters & Naming")
+        self.tabs.addTab(QWidget(), _FILTERS_TAB_TITLE)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tabs)
 
@@ -47,94 +274,85 @@ class AdvancedSettingsDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addWidget(self.button_box)
 
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index):
+        if index == _FILTERS_TAB_INDEX:
+            self._ensure_filters_naming_tab()
+
+    def _ensure_filters_naming_tab(self):
+        if self.filters_naming_tab is not None:
+            return
+        self.filters_naming_tab = self._create_filters_naming_tab()
+        current = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(_FILTERS_TAB_INDEX)
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(_FILTERS_TAB_INDEX)
+            self.tabs.insertTab(
+                _FILTERS_TAB_INDEX, self.filters_naming_tab, _FILTERS_TAB_TITLE
+            )
+            self.tabs.setCurrentIndex(current)
+        placeholder.deleteLater()
+
     def _create_general_tab(self):
+        # One grid for the whole tab: labels and fields on the left, flags on
+        # the right, with bold labels as section headers instead of group boxes.
+        # The themes style "SectionHeader" labels like group box titles and
+        # indent the rows of a "SectionedPage" under them.
         widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 10, 5, 5)
-
-        col1_layout = QVBoxLayout()
-        concurrency_group = QGroupBox("Concurrency")
-        concurrency_form = QFormLayout(concurrency_group)
-        tasks_widget, self.concurrent_tasks_spinbox = self._create_spinbox_with_arrows(
-            1, 16, 2
-        )
-        self.concurrent_tasks_spinbox.setToolTip(
-            "Set the maximum number of files to download at the same time."
-        )
-        threads_widget, self.threads_per_task_spinbox = (
-            self._create_spinbox_with_arrows(1, 16, 4)
-        )
-        self.threads_per_task_spinbox.setToolTip(
-            "Set the maximum number of parallel connections for a single file."
-        )
-        concurrency_form.addRow("Concurrent Tasks:", tasks_widget)
-        concurrency_form.addRow("Threads per Task:", threads_widget)
-        col1_layout.addWidget(concurrency_group)
-
-        pool_group = QGroupBox("Connection")
-        pool_form = QFormLayout(pool_group)
-        pool_widget, self.pool_spinbox = self._create_spinbox_with_arrows(0, 100, 8)
-        self.pool_spinbox.setToolTip(
-            "Advanced: The size of the DC pool for the Telegram client.\nLeave at 8 unless you have connection issues."
-        )
-        pool_form.addRow("DC Pool Size:", pool_widget)
-        col1_layout.addWidget(pool_group)
-
-        delay_group = QGroupBox("Rate Limiting")
-        delay_form = QFormLayout(delay_group)
-        delay_layout = QHBoxLayout()
-        delay_widget, self.delay_spinbox = self._create_spinbox_with_arrows(0, 99999, 0)
-        self.delay_spinbox.setToolTip(
-            "Wait a specified amount of time between download tasks to avoid API rate limits."
-        )
+        widget.setObjectName("SectionedPage")
+        grid = QGridLayout(widget)
+        grid.setContentsMargins(5, 10, 5, 5)
+        grid.setColumnStretch(1, 1)
+        grid.setColumnStretch(2, 1)
+
+        row = self._add_section_header(grid, 0, 0, "Concurrency")
+        row = self._add_spinbox_rows(grid, row, _CONCURRENCY_FIELDS)
+        row = self._add_section_header(grid, row, 0, "Connection")
+        row = self._add_spinbox_rows(grid, row, _CONNECTION_FIELDS)
+
+        row = self._add_section_header(grid, row, 0, "Rate Limiting")
+        delay_widget, self.delay_spinbox = make_spinbox_with_arrows(0, 99999, 0)
+        self.delay_spinbox.setToolTip(_TOOLTIPS["delay"])
         self.delay_unit_combo = QComboBox()
-        self.delay_unit_combo.addItems(["ms", "s", "m"])
-        delay_layout.addWidget(delay_widget, 1)
-        delay_layout.addWidget(self.delay_unit_combo)
-        delay_form.addRow("Delay per Task:", delay_layout)
-        col1_layout.addWidget(delay_group)
-        col1_layout.addStretch()
-
-        col2_layout = QVBoxLayout()
-        flags_group = QGroupBox("Behavioral Flags")
-        flags_layout = QVBoxLayout(flags_group)
-        self.desc_checkbox = QCheckBox("Download in descending order")
-        self.desc_checkbox.setToolTip(
-            "Download files from newest to oldest instead of the default (oldest to newest)."
-        )
-        self.skip_same_checkbox = QCheckBox("Skip identical files")
-        self.skip_same_checkbox.setToolTip(
-            "If a file with the same name and size already exists in the destination, skip it."
-        )
-        self.skip_same_checkbox.setChecked(True)
-        self.rewrite_ext_checkbox = QCheckBox("Rewrite file extension")
-        self.rewrite_ext_checkbox.setToolTip(
-            "Renames the file extension based on its actual content type (MIME type)."
+        self.delay_unit_combo.setModel(
+            QStringListModel(list(_DELAY_UNITS), self.delay_unit_combo)
         )
-        self.group_checkbox = QCheckBox("Auto-download albums/groups")
-        self.group_checkbox.setToolTip(
-            "If a message link points to a file in an album, download all other files in that album automatically."
-        )
-        self.takeout_checkbox = QCheckBox("Use takeout session (lowers limits)")
-        self.takeout_checkbox.setToolTip(
-            "Use a special session type that is less prone to API rate limits.\nUseful for very large downloads."
-        )
-        flags = [
-            self.desc_checkbox,
-            self.skip_same_checkbox,
-            self.rewrite_ext_checkbox,
-            self.group_checkbox,
-            self.takeout_checkbox,
-        ]
-        for flag in flags:
-            flags_layout.addWidget(flag)
-        flags_layout.addStretch()
-        col2_layout.addWidget(flags_group)
-
-        layout.addLayout(col1_layout, 1)
-        layout.addLayout(col2_layout, 1)
+        delay_widget.layout().addWidget(self.delay_unit_combo)
+        grid.addWidget(QLabel("Delay per Task:"), row, 0)
+        grid.addWidget(delay_widget, row, 1)
+        last_row = row + 1
+
+        row = self._add_section_header(grid, 0, 2, "Behavioral Flags")
+        for name, text, checked, tooltip in _FLAG_FIELDS:
+            checkbox = QCheckBox(text)
+            checkbox.setToolTip(tooltip)
+            checkbox.setChecked(checked)
+            setattr(self, name, checkbox)
+            grid.addWidget(checkbox, row, 2)
+            row += 1
+
+        grid.setRowStretch(max(row, last_row), 1)
         return widget
 
+    @staticmethod
+    def _add_section_header(grid, row, column, title):
+        header = QLabel(f"<b>{title}</b>")
+        header.setObjectName("SectionHeader")
+        grid.addWidget(header, row, column, 1, 2)
+        return row + 1
+
+    def _add_spinbox_rows(self, grid, row, fields):
+        for name, label, min_val, max_val, default_val, tooltip in fields:
+            container, spinbox = make_spinbox_with_arrows(
+                min_val, max_val, default_val
+            )
+            spinbox.setToolTip(tooltip)
+            setattr(self, name, spinbox)
+            grid.addWidget(QLabel(label), row, 0)
+            grid.addWidget(container, row, 1)
+            row += 1
+        return row
+
     def _create_filters_naming_tab(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -142,43 +360,28 @@ class AdvancedSettingsDialog(QDialog):
 
         filters_group = QGroupBox("File Filters")
         filters_form = QFormLayout(filters_group)
-        self.include_ext_input = QLineEdit()
-        self.include_ext_input.setPlaceholderText("e.g., mp4,mkv,zip")
-        self.include_ext_input.setToolTip(
-            "Only download files with these extensions. Cannot be used with Exclude."
-        )
-        self.exclude_ext_input = QLineEdit()
-        self.exclude_ext_input.setPlaceholderText("e.g., jpg,png,gif")
-        self.exclude_ext_input.setToolTip(
-            "Do not download files with these extensions. Cannot be used with Include."
-        )
-        filters_form.addRow("Include Exts:", self.include_ext_input)
-        filters_form.addRow("Exclude Exts:", self.exclude_ext_input)
+        for name, label, placeholder, tooltip in _FILTER_FIELDS:
+            line_edit = QLineEdit()
+            line_edit.setPlaceholderText(placeholder)
+            line_edit.setToolTip(tooltip)
+            setattr(self, name, line_edit)
+            filters_form.addRow(label, line_edit)
         layout.addWidget(filters_group)
 
         template_group = QGroupBox("Filename Template")
         template_v_layout = QVBoxLayout(template_group)
         template_h_layout = QHBoxLayout()
         self.template_combo = QComboBox()
-        self.template_combo.addItems(
-            [
-                "Default: {{ .DialogID }}_{{ .MessageID }}_{{ filenamify .FileName }}",
-                "{{ .DialogID }}/{{ .FileName }}",
-                "{{ .MessageID }}-{{ .FileName }}",
-                "{{ .FileName }}",
-                "Custom...",
-            ]
+        self.template_combo.setModel(
+            QStringListModel(list(_TEMPLATE_CHOICES), self.template_combo)
         )
         self.template_input = QLineEdit()
         self.template_input.setPlaceholderText("Enter custom template...")
         self.template_input.setVisible(False)
         template_help_button = QToolButton()
-        icon = self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxQuestion)
-        template_help_button.setIcon(icon)
+        template_help_button.setIcon(_get_help_icon(self.style()))
         template_help_button.clicked.connect(
-            lambda: QDesktopServices.openUrl(
-                QUrl("https://docs.iyear.me/tdl/guide/template/")
-            )
+            partial(QDesktopServices.openUrl, _TEMPLATE_HELP_URL)
         )
         template_h_layout.addWidget(self.template_combo, 1)
         template_h_layout.addWidget(self.template_input, 1)
@@ -197,26 +400,26 @@ class AdvancedSettingsDialog(QDialog):
         layout.addStretch()
         return widget
 
+    @pyqtSlot(str)
     def _on_template_changed(self, text):
         """Shows or hides the custom template input field based on the combo box selection."""
-        is_custom = text == "Custom..."
+        is_custom = text == _CUSTOM_TEMPLATE_LABEL
+        # Toggle both widgets within a single update cycle.
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
         self.template_input.setVisible(is_custom)
         self.placeholder_widget.setVisible(is_custom)
+        self.setUpdatesEnabled(updates_enabled)
 
     def _create_template_placeholders(self):
         widget = QWidget()
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(0, 5, 0, 0)
-        placeholders = [
-            "FileName",
-            "MessageID",
-            "DialogID",
-            "FileSize",
-            "Ext",
-            "Date",
-            "Time",
-        ]
-        for placeholder in placeholders:
+
+        # Add all buttons in one go instead of relaying out after each one.
+        widget.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        for placeholder in _TEMPLATE_PLACEHOLDERS:
             button = QToolButton()
             button.setText(f"{{{placeholder}}}")
             button.clicked.connect(
@@ -224,82 +427,47 @@ class AdvancedSettingsDialog(QDialog):
             )
             layout.addWidget(button)
         layout.addStretch()
+        layout.setEnabled(True)
+        widget.setUpdatesEnabled(True)
         return widget
 
     def get_settings(self):
         """Retrieves all settings from the dialog's UI controls."""
-        template_text = self.template_combo.currentText()
-        if template_text == "Custom...":
+        self._ensure_ui()
+        if self.filters_naming_tab is None:
+            # Never opened, so its fields still hold their defaults.
+            include_exts = exclude_exts = ""
+            template_text = _TEMPLATE_CHOICES[0]
+        else:
+            include_exts = self.include_ext_input.text()
+            exclude_exts = self.exclude_ext_input.text()
+            template_text = self.template_combo.currentText()
+        if template_text == _CUSTOM_TEMPLATE_LABEL:
             final_template = self.template_input.text()
+        elif template_text == _DEFAULT_TEMPLATE_LABEL:
+            final_template = _DEFAULT_TEMPLATE_VALUE
         else:
-            final_template = template_text.removeprefix("Default: ")
-
-        return {
-            "concurrent_tasks": self.concurrent_tasks_spinbox.value(),
-            "threads_per_task": self.threads_per_task_spinbox.value(),
-            "pool_size": self.pool_spinbox.value(),
-            "delay": self.delay_spinbox.value(),
-            "delay_unit": self.delay_unit_combo.currentText(),
-            "desc_order": self.desc_checkbox.isChecked(),
-            "skip_same": self.skip_same_checkbox.isChecked(),
-            "rewrite_ext": self.rewrite_ext_checkbox.isChecked(),
-            "group_albums": self.group_checkbox.isChecked(),
-            "use_takeout": self.takeout_checkbox.isChecked(),
-            "include_exts": self.include_ext_input.text(),
-            "exclude_exts": self.exclude_ext_input.text(),
-            "template": final_template,
-        }
-
-    def _create_spinbox_with_arrows(self, min_val, max_val, default_val):
-        # This is a helper method copied from main_window.py
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(2)
-
-        spinbox = QSpinBox()
-        spinbox.setRange(min_val, max_val)
-        spinbox.setValue(default_val)
-        spinbox.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
-
-        up_button = QToolButton(arrowType=Qt.ArrowType.UpArrow, clicked=spinbox.stepUp)
-        down_button = QToolButton(
-            arrowType=Qt.ArrowType.DownArrow, clicked=spinbox.stepDown
+            final_template = template_text
+
+        return DownloadSettings(
+            concurrent_tasks=self.concurrent_tasks_spinbox.value(),
+            threads_per_task=self.threads_per_task_spinbox.value(),
+            pool_size=self.pool_spinbox.value(),
+            delay=self.delay_spinbox.value(),
+            delay_unit=self.delay_unit_combo.currentText(),
+            desc_order=self.desc_checkbox.isChecked(),
+            skip_same=self.skip_same_checkbox.isChecked(),
+            rewrite_ext=self.rewrite_ext_checkbox.isChecked(),
+            group_albums=self.group_checkbox.isChecked(),
+            use_takeout=self.takeout_checkbox.isChecked(),
+            include_exts=include_exts,
+            exclude_exts=exclude_exts,
+            template=final_template,
         )
 
-        layout.addWidget(spinbox, 1)
-        layout.addWidget(down_button)
-        layout.addWidget(up_button)
-        return container, spinbox
-
+    @pyqtSlot(str)
     def insert_template_placeholder(self, placeholder):
-        self.template_combo.setCurrentText("Custom...")
+        self.template_combo.setCurrentText(_CUSTOM_TEMPLATE_LABEL)
         self.template_input.setFocus()
-        cursor_pos = self.template_input.cursorPosition()
-        current_text = self.template_input.text()
-        new_text = f"{current_text[:cursor_pos]}{{{{ .{placeholder} }}}}{current_text[cursor_pos:]}"
-        self.template_input.setText(new_text)
-        self.template_input.setCursorPosition(
-            cursor_pos + len(f"{{{{ .{placeholder} }}}}")
-        )
-
-    def _create_spinbox_with_arrows(self, min_val, max_val, default_val):
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(2)
-
-        spinbox = QSpinBox()
-        spinbox.setRange(min_val, max_val)
-        spinbox.setValue(default_val)
-        spinbox.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
-
-        up_button = QToolButton(arrowType=Qt.ArrowType.UpArrow, clicked=spinbox.stepUp)
-        down_button = QToolButton(
-            arrowType=Qt.ArrowType.DownArrow, clicked=spinbox.stepDown
-        )
-
-        layout.addWidget(spinbox, 1)
-        layout.addWidget(down_button)
-        layout.addWidget(up_button)
-        return container, spinbox
+        # insert() splices at the cursor and advances it past the token.
+        self.template_input.insert(f"{{{{ .{placeholder} }}}}")
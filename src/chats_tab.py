@@ -1,18 +1,86 @@
-import json
-from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtCore import (
+    pyqtSignal,
+    pyqtSlot,
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+)
 from PyQt6.QtWidgets import (
+    QApplication,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QMenu,
     QMessageBox,
 )
 
-from src.config import CHAT_NAME_COLORS
+from src.config import CHAT_NAME_COLORS, N_CHAT_COLORS
+
+_NO_COLOR = 0xFF
+
+
+class ChatsModel(QAbstractTableModel):
+    """
+    A read-only table model over a plain list of chat row tuples
+    (name, type, id, username), so no per-cell items are allocated.
+    """
+
+    HEADERS = ("Name", "Type", "ID", "Username")
+    ID_COLUMN = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # One byte per row: index into CHAT_NAME_COLORS, or _NO_COLOR.
+        self._color_indices = bytearray()
+        # Chat ID -> colour index, kept across refreshes of the same account.
+        self._color_cache = {}
+
+    def set_rows(self, rows):
+        """Replaces all rows with a single model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        color_index_for_id = self._color_index_for_id
+        self._color_indices = bytearray(color_index_for_id(row[2]) for row in rows)
+        self.endResetModel()
+
+    def _color_index_for_id(self, id_str):
+        if not id_str:
+            return _NO_COLOR
+        color_index = self._color_cache.get(id_str)
+        if color_index is None:
+            color_index = hash(id_str) % N_CHAT_COLORS
+            self._color_cache[id_str] = color_index
+        return color_index
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == 0:
+            color_index = self._color_indices[index.row()]
+            if color_index != _NO_COLOR:
+                return CHAT_NAME_COLORS[color_index]
+        return None
 
 
 class ChatsTab(QWidget):
@@ -27,23 +95,31 @@ class ChatsTab(QWidget):
         self.settings_manager = settings_manager
         self.logger = logger
         self.worker = None
-        self.controls = []
 
         self._init_ui()
         self._setup_connections()
 
     def _init_ui(self):
-        layout = QVBoxLayout(self)
-
-        self.chats_table = QTableWidget()
-        self.chats_table.setColumnCount(4)
-        self.chats_table.setHorizontalHeaderLabels(["Name", "Type", "ID", "Username"])
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        # Everything that is disabled while a task runs lives in one container,
+        # so a single setEnabled() call propagates to all of it.
+        self._runnable_group = QWidget()
+        outer_layout.addWidget(self._runnable_group)
+        layout = QVBoxLayout(self._runnable_group)
+
+        self.chats_model = ChatsModel(self)
+        self.chats_proxy_model = QSortFilterProxyModel(self)
+        self.chats_proxy_model.setSourceModel(self.chats_model)
+
+        self.chats_table = QTableView()
+        self.chats_table.setModel(self.chats_proxy_model)
         self.chats_table.horizontalHeader().setSectionResizeMode(
             QHeaderView.ResizeMode.Stretch
         )
         self.chats_table.verticalHeader().setVisible(False)
-        self.chats_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.chats_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.chats_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.chats_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.chats_table.setSortingEnabled(True)
         self.chats_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
 
@@ -58,7 +134,13 @@ class ChatsTab(QWidget):
         layout.addWidget(self.chats_table)
         layout.addLayout(button_layout)
 
-        self.controls.extend([self.refresh_chats_button, self.chats_table])
+        # The context menu is built once and re-shown on each right-click.
+        self._chat_menu = QMenu(self)
+        self._copy_id_action = self._chat_menu.addAction("Copy Chat ID")
+        self._export_messages_action = self._chat_menu.addAction(
+            "Export Messages..."
+        )
+        self._export_members_action = self._chat_menu.addAction("Export Members...")
 
     def _setup_connections(self):
         self.refresh_chats_button.clicked.connect(self.handle_refresh_chats)
@@ -66,6 +148,7 @@ class ChatsTab(QWidget):
             self._show_chat_context_menu
         )
 
+    @pyqtSlot()
     def handle_refresh_chats(self):
         if self.tdl_runner.is_running():
             self.logger.warning(
@@ -81,83 +164,59 @@ class ChatsTab(QWidget):
             return
 
         self.task_started.emit(self.worker)
-        self.worker.taskData.connect(self._populate_chats_table)
+        self.worker.chatsParsed.connect(self._populate_chats_table)
+        self.worker.chatsParseFailed.connect(self._on_chats_parse_failed)
         self.worker.taskFinished.connect(self.task_finished)
         self.worker.start()
 
+    @pyqtSlot('QPoint')
     def _show_chat_context_menu(self, position):
-        selected_items = self.chats_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.chats_table.selectionModel().selectedRows(
+            ChatsModel.ID_COLUMN
+        )
+        if not selected_rows:
             return
 
-        selected_row = selected_items[0].row()
-        chat_id_item = self.chats_table.item(selected_row, 2)
-        if not chat_id_item:
+        chat_id = selected_rows[0].data()
+        if not chat_id:
             return
-        chat_id = chat_id_item.text()
-
-        menu = QMenu()
-        copy_id_action = menu.addAction("Copy Chat ID")
-        export_messages_action = menu.addAction("Export Messages...")
-        export_members_action = menu.addAction("Export Members...")
 
-        action = menu.exec(self.chats_table.viewport().mapToGlobal(position))
+        action = self._chat_menu.exec(
+            self.chats_table.viewport().mapToGlobal(position)
+        )
 
-        if action == copy_id_action:
+        if action is self._copy_id_action:
             self._handle_copy_chat_id(chat_id)
-        elif action == export_messages_action:
+        elif action is self._export_messages_action:
             self.export_chat_messages.emit(chat_id)
-        elif action == export_members_action:
+        elif action is self._export_members_action:
             self.export_chat_members.emit(chat_id)
 
+    @pyqtSlot(str)
     def _handle_copy_chat_id(self, chat_id):
-        from PyQt6.QtWidgets import QApplication
-
-        clipboard = QApplication.clipboard()
-        clipboard.setText(chat_id)
+        QApplication.clipboard().setText(chat_id)
         self.logger.info(f"Copied Chat ID to clipboard: {chat_id}")
 
-    def _populate_chats_table(self, json_data):
-        try:
-            chats = json.loads(json_data)
-            self.chats_table.setSortingEnabled(False)
-            self.chats_table.setRowCount(0)
-
-            for chat in chats:
-                row_position = self.chats_table.rowCount()
-                self.chats_table.insertRow(row_position)
-
-                name = chat.get("visible_name", "")
-                type = chat.get("type", "")
-                id_str = str(chat.get("id", ""))
-                username = chat.get("username", "")
-
-                name_item = QTableWidgetItem(name)
-                if id_str:
-                    color_index = hash(id_str) % len(CHAT_NAME_COLORS)
-                    name_item.setForeground(CHAT_NAME_COLORS[color_index])
-
-                self.chats_table.setItem(row_position, 0, name_item)
-                self.chats_table.setItem(row_position, 1, QTableWidgetItem(type))
-                self.chats_table.setItem(row_position, 2, QTableWidgetItem(id_str))
-                self.chats_table.setItem(row_position, 3, QTableWidgetItem(username))
-
-            self.chats_table.setSortingEnabled(True)
-            self.logger.info(
-                f"Successfully populated chats table with {len(chats)} chats."
-            )
+    @pyqtSlot(list)
+    def _populate_chats_table(self, rows):
+        """Receives chat rows already parsed on the worker thread."""
+        self.chats_model.set_rows(rows)
+        self.logger.info(
+            f"Successfully populated chats table with {len(rows)} chats."
+        )
 
-        except json.JSONDecodeError:
-            self.logger.error("Failed to parse JSON data from 'tdl chat ls' command.")
-            QMessageBox.critical(
-                self,
-                "Error",
-                "Could not parse the chat list from tdl. See logs for details.",
-            )
+    @pyqtSlot()
+    def _on_chats_parse_failed(self):
+        QMessageBox.critical(
+            self,
+            "Error",
+            "Could not parse the chat list from tdl. See logs for details.",
+        )
 
+    @pyqtSlot(bool)
+    @pyqtSlot(bool, bool)
     def set_running_state(self, is_running, is_active_task=False):
         """Enable or disable controls based on task status."""
         # The main interaction on this tab is refreshing the list.
         # We should disable all controls if any task is running anywhere.
-        for control in self.controls:
-            control.setEnabled(not is_running)
+        self._runnable_group.setEnabled(not is_running)
@@ -1,58 +1,62 @@
+from types import MappingProxyType
+
 from PyQt6.QtGui import QColor
 
-# Configuration for utility commands
-UTILITY_CONFIGS = {
-    "export_members_by_id": {
+# Configuration for utility commands (read-only; copy before modifying)
+UTILITY_CONFIGS = MappingProxyType({
+    "export_members_by_id": MappingProxyType({
         "title": "Export Members by ID",
-        "base_cmd": ["tdl", "chat", "users"],
-        "fields": [
-            {"name": "chat_id", "label": "Chat ID or Username:", "arg": "-c"},
-            {
+        "base_cmd": ("tdl", "chat", "users"),
+        "fields": (
+            MappingProxyType(
+                {"name": "chat_id", "label": "Chat ID or Username:", "arg": "-c"}
+            ),
+            MappingProxyType({
                 "name": "output_file",
                 "label": "Output JSON File:",
                 "arg": "-o",
                 "type": "save_file",
-            },
-        ],
-    },
-    "backup_data": {
+            }),
+        ),
+    }),
+    "backup_data": MappingProxyType({
         "title": "Backup Data",
-        "base_cmd": ["tdl", "backup"],
-        "fields": [
-            {
+        "base_cmd": ("tdl", "backup"),
+        "fields": (
+            MappingProxyType({
                 "name": "output_file",
                 "label": "Backup File Path:",
                 "arg": "-d",
                 "type": "save_file",
-            }
-        ],
-    },
-    "recover_data": {
+            }),
+        ),
+    }),
+    "recover_data": MappingProxyType({
         "title": "Recover Data",
-        "base_cmd": ["tdl", "recover"],
-        "fields": [
-            {
+        "base_cmd": ("tdl", "recover"),
+        "fields": (
+            MappingProxyType({
                 "name": "input_file",
                 "label": "Backup File to Restore:",
                 "arg": "-f",
                 "type": "open_file",
-            }
-        ],
-    },
-    "migrate_data": {
+            }),
+        ),
+    }),
+    "migrate_data": MappingProxyType({
         "title": "Migrate Data",
-        "base_cmd": ["tdl", "migrate"],
-        "fields": [
-            {
+        "base_cmd": ("tdl", "migrate"),
+        "fields": (
+            MappingProxyType({
                 "name": "destination",
                 "label": "Destination Storage (e.g., type=file,path=...):",
                 "arg": "--to",
-            }
-        ],
-    },
-}
+            }),
+        ),
+    }),
+})
 
-CHAT_NAME_COLORS = [
+CHAT_NAME_COLORS = (
     QColor("#1ABC9C"),
     QColor("#2ECC71"),
     QColor("#3498DB"),
@@ -71,4 +75,5 @@ CHAT_NAME_COLORS = [
     QColor("#D35400"),
     QColor("#C0392B"),
     QColor("#7F8C8D"),
-]
+)
+N_CHAT_COLORS = len(CHAT_NAME_COLORS)
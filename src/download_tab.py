@@ -1,5 +1,15 @@
 import os
-from PyQt6.QtCore import QDir, pyqtSignal
+import re
+
+from PyQt6.QtCore import (
+    QDir,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Qt,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,13 +20,111 @@ from PyQt6.QtWidgets import (
     QToolButton,
     QPlainTextEdit,
     QFileDialog,
-    QScrollArea,
-    QLabel,
+    QListView,
     QStyle,
 )
 
 from src.advanced_settings_dialog import AdvancedSettingsDialog
-from src.progress_widget import DownloadProgressWidget
+from src.progress_widget import DownloadProgressDelegate, DownloadProgressModel
+
+# Loaded source files are inserted in slices of about this many characters,
+# one per event loop pass.
+_LOAD_CHUNK_SIZE = 1 << 20
+# One match per non-empty source line, without surrounding whitespace:
+# group 1 if it ends in ".json", otherwise group 2.
+_SOURCE_LINE_RX = re.compile(
+    r"^[^\S\n]*(?:((?:\S.*?)?\.json)|(\S.*?))[^\S\n]*$", re.MULTILINE
+)
+# DownloadSettings fields passed as '<option> <value>' when non-empty...
+_OPTIONAL_VALUE_OPTIONS = (("include_exts", "-i"), ("exclude_exts", "-e"))
+# ...and boolean fields passed as bare flags when set.
+_BOOL_FLAGS = (
+    ("desc_order", "--desc"),
+    ("skip_same", "--skip-same"),
+    ("rewrite_ext", "--rewrite-ext"),
+    ("group_albums", "--group"),
+    ("use_takeout", "--takeout"),
+)
+# Per-file progress updates are coalesced and applied at most this often.
+_PROGRESS_FLUSH_INTERVAL_MS = 100
+# Source files sharing a directory are checked with one os.scandir() of it
+# once there are at least this many; fewer are stat()ed individually.
+_SCANDIR_MIN_PATHS = 32
+
+
+def _iter_line_chunks(text, size):
+    """Yields slices of roughly `size` characters, split only at newlines."""
+    if not text:
+        return
+    start = 0
+    while True:
+        end = text.find("\n", start + size)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _existing_paths(paths):
+    """
+    Returns the subset of `paths` that os.path.exists() accepts. A directory
+    holding many of them is listed once with os.scandir instead of stat()ing
+    every path; a listing costs more than a few stats, so smaller groups are
+    still checked one by one.
+    """
+    by_dir = {}
+    for path in paths:
+        directory, name = os.path.split(path)
+        by_dir.setdefault(directory, []).append((path, name))
+
+    normcase = os.path.normcase
+    existing = set()
+    for directory, entries in by_dir.items():
+        if len(entries) < _SCANDIR_MIN_PATHS:
+            existing.update(path for path, _ in entries if os.path.exists(path))
+            continue
+        wanted = {normcase(name) for _, name in entries}
+        found = set()
+        try:
+            with os.scandir(directory or os.curdir) as it:
+                for entry in it:
+                    name = normcase(entry.name)
+                    # exists() follows symlinks, so a dangling one doesn't count
+                    if name in wanted and (
+                        not entry.is_symlink() or os.path.exists(entry.path)
+                    ):
+                        found.add(name)
+        except OSError:
+            continue
+        existing.update(path for path, name in entries if normcase(name) in found)
+    return existing
+
+
+class _FileLoadSignals(QObject):
+    loaded = pyqtSignal(str, str)  # filepath, text
+    failed = pyqtSignal(str, str)  # filepath, error message
+
+
+class _FileLoadRunnable(QRunnable):
+    """Reads a source list file on a pool thread and reports back via signals."""
+
+    def __init__(self, filepath, signals):
+        super().__init__()
+        self.filepath = filepath
+        self.signals = signals
+
+    def run(self):
+        try:
+            # Binary read + decode skips universal-newline translation. CRLF
+            # is folded here, before the text is sliced at "\n": a stray
+            # "\r" left at the end of a slice would become an empty line.
+            with open(self.filepath, "rb") as f:
+                text = f.read().decode("utf-8", "replace").replace("\r\n", "\n")
+        except Exception as e:
+            self.signals.failed.emit(self.filepath, str(e))
+        else:
+            self.signals.loaded.emit(self.filepath, text)
 
 
 class DownloadTab(QWidget):
@@ -25,6 +133,19 @@ class DownloadTab(QWidget):
     overall_progress_updated = pyqtSignal(dict)
     system_stats_updated = pyqtSignal(dict)
 
+    # (worker signal, tab slot or signal) pairs wired up for every download
+    _WORKER_SIGNAL_MAP = (
+        ("downloadStarted", "add_download_progress_widget"),
+        ("downloadProgress", "update_download_progress"),
+        ("downloadFinished", "remove_download_progress_widget"),
+        ("overallProgress", "overall_progress_updated"),
+        ("statsUpdated", "system_stats_updated"),
+        ("taskFinished", "task_finished"),
+    )
+
+    # StandardPixmap -> QIcon, shared by all instances
+    _icon_cache = {}
+
     def __init__(self, tdl_runner, settings_manager, logger, parent=None):
         super().__init__(parent)
         self.setObjectName("DownloadTab")
@@ -32,10 +153,27 @@ class DownloadTab(QWidget):
         self.settings_manager = settings_manager
         self.logger = logger
         self.worker = None
-        self.advanced_settings = {}
-        self.progress_widgets = {}
-        self.controls = []
+        self.advanced_settings = None
+        self._advanced_dialog = None
+        # file_id -> latest progress data not yet shown
+        self._pending_progress = {}
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.setInterval(_PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
         self.has_started_download = False
+        self._file_load_signals = _FileLoadSignals(self)
+        self._file_load_signals.loaded.connect(self._on_source_file_loaded)
+        self._file_load_signals.failed.connect(self._on_source_file_failed)
+        # Set from picking a source file until it is fully inserted.
+        self._loading_sources = False
+        # Slices of the loaded file still to be inserted
+        self._source_chunks = None
+        self._source_load_path = None
+        self._source_load_timer = QTimer(self)
+        self._source_load_timer.setSingleShot(True)
+        self._source_load_timer.setInterval(0)
+        self._source_load_timer.timeout.connect(self._insert_next_source_chunk)
 
         self._init_ui()
         self._setup_connections()
@@ -66,23 +204,19 @@ class DownloadTab(QWidget):
         action_button_layout.addWidget(self.resume_download_button)
         action_button_layout.addStretch()
 
-        main_layout.addWidget(source_group)
-        main_layout.addWidget(dest_group)
+        # The source and destination inputs share one container so a single
+        # setEnabled() call toggles all of them while a task runs.
+        self._inputs_container = QWidget()
+        inputs_layout = QVBoxLayout(self._inputs_container)
+        inputs_layout.setContentsMargins(0, 0, 0, 0)
+        inputs_layout.setSpacing(main_layout.spacing())
+        inputs_layout.addWidget(source_group)
+        inputs_layout.addWidget(dest_group)
+
+        main_layout.addWidget(self._inputs_container)
         main_layout.addLayout(action_button_layout)
         main_layout.addWidget(progress_group)
 
-        self.controls.extend(
-            [
-                self.source_input,
-                self.load_from_file_button,
-                self.clear_source_button,
-                self.dest_path_input,
-                self.browse_dest_button,
-                self.advanced_settings_button,
-                self.resume_download_button,
-            ]
-        )
-
     def _setup_connections(self):
         """Connects signals to slots for the download tab."""
         self.start_download_button.clicked.connect(self.handle_download_button)
@@ -94,8 +228,18 @@ class DownloadTab(QWidget):
             self.open_advanced_settings_dialog
         )
 
+    @staticmethod
+    def _get_icon(style, standard_pixmap):
+        """Returns a standard style icon, fetching each one from the style only once."""
+        icon = DownloadTab._icon_cache.get(standard_pixmap)
+        if icon is None:
+            icon = style.standardIcon(standard_pixmap)
+            DownloadTab._icon_cache[standard_pixmap] = icon
+        return icon
+
     def _create_source_group(self):
         group = QGroupBox("Source Input")
+        self._source_group = group
         layout = QVBoxLayout(group)
         self.source_input = QPlainTextEdit()
         self.source_input.setPlaceholderText(
@@ -108,7 +252,7 @@ class DownloadTab(QWidget):
         button_layout = QHBoxLayout()
         self.load_from_file_button = QPushButton("Load from File...")
         self.load_from_file_button.setIcon(
-            self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon)
+            self._get_icon(self.style(), QStyle.StandardPixmap.SP_DirOpenIcon)
         )
         self.load_from_file_button.setToolTip(
             "Load a list of sources from a text file."
@@ -116,7 +260,7 @@ class DownloadTab(QWidget):
 
         self.clear_source_button = QPushButton("Clear")
         self.clear_source_button.setIcon(
-            self.style().standardIcon(QStyle.StandardPixmap.SP_DialogResetButton)
+            self._get_icon(self.style(), QStyle.StandardPixmap.SP_DialogResetButton)
         )
         self.clear_source_button.setToolTip("Clear all text from the source input box.")
 
@@ -137,7 +281,7 @@ class DownloadTab(QWidget):
 
         self.browse_dest_button = QToolButton()
         self.browse_dest_button.setObjectName("BrowseButton")
-        icon = self.style().standardIcon(QStyle.StandardPixmap.SP_DirOpenIcon)
+        icon = self._get_icon(self.style(), QStyle.StandardPixmap.SP_DirOpenIcon)
         self.browse_dest_button.setIcon(icon)
         self.browse_dest_button.setToolTip("Browse for destination directory")
 
@@ -148,20 +292,26 @@ class DownloadTab(QWidget):
     def _create_progress_group(self):
         group = QGroupBox("Live Downloads")
         layout = QVBoxLayout(group)
-        progress_area = QScrollArea()
-        progress_area.setWidgetResizable(True)
-        progress_area.setMinimumHeight(150)
-
-        progress_widget_container = QWidget()
-        self.progress_layout = QVBoxLayout(progress_widget_container)
-        self.progress_layout.addStretch()
-        progress_area.setWidget(progress_widget_container)
-
-        layout.addWidget(progress_area)
+        # A virtualized list: rows are painted by the delegate, so only the
+        # visible downloads cost anything regardless of batch size.
+        self.progress_model = DownloadProgressModel(self)
+        self.progress_view = QListView()
+        self.progress_view.setModel(self.progress_model)
+        self.progress_view.setItemDelegate(DownloadProgressDelegate(self.progress_view))
+        self.progress_view.setUniformItemSizes(True)
+        self.progress_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.progress_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.progress_view.setMinimumHeight(150)
+
+        layout.addWidget(self.progress_view)
         return group
 
     def open_advanced_settings_dialog(self):
-        dialog = AdvancedSettingsDialog(self)
+        # Kept between clicks so its widgets are only built the first time
+        dialog = self._advanced_dialog
+        if dialog is None:
+            dialog = AdvancedSettingsDialog(self)
+            self._advanced_dialog = dialog
         if dialog.exec():
             self.advanced_settings = dialog.get_settings()
             self.logger.info("Advanced settings saved.")
@@ -180,86 +330,122 @@ class DownloadTab(QWidget):
             self, "Load Source File", QDir.homePath(), "Text Files (*.txt)"
         )
         if filepath:
-            try:
-                with open(filepath, "r") as f:
-                    self.source_input.setPlainText(f.read())
-                self.logger.info(f"Loaded sources from {filepath}")
-            except Exception as e:
-                self.logger.error(f"Error reading file {filepath}: {e}")
+            # The source box and its buttons stay disabled until the file is
+            # fully inserted, so nothing edits or reloads it halfway through.
+            self._set_loading_sources(True)
+            QThreadPool.globalInstance().start(
+                _FileLoadRunnable(filepath, self._file_load_signals)
+            )
+
+    def _set_loading_sources(self, loading):
+        self._loading_sources = loading
+        self._source_group.setEnabled(not loading)
+
+    def _on_source_file_loaded(self, filepath, text):
+        self._set_loading_sources(True)
+        self.source_input.setUpdatesEnabled(False)
+        self.source_input.clear()
+        self._source_chunks = _iter_line_chunks(text, _LOAD_CHUNK_SIZE)
+        self._source_load_path = filepath
+        self._insert_next_source_chunk()
+
+    def _insert_next_source_chunk(self):
+        """Appends one slice of the file being loaded and schedules the next."""
+        chunk = next(self._source_chunks, None)
+        if chunk is not None:
+            self.source_input.appendPlainText(chunk)
+            self._source_load_timer.start()
+            return
+
+        self._source_chunks = None
+        self.source_input.setUpdatesEnabled(True)
+        self._set_loading_sources(False)
+        self.logger.info(f"Loaded sources from {self._source_load_path}")
+
+    def _on_source_file_failed(self, filepath, error):
+        self._set_loading_sources(False)
+        self.logger.error(f"Error reading file {filepath}: {error}")
 
     def handle_download_button(self):
         if self.tdl_runner.is_running():
             self.tdl_runner.stop()
             return
 
-        source_text = self.source_input.toPlainText().strip()
-        if not source_text:
-            self.logger.error("Source input cannot be empty.")
+        if self._loading_sources:
+            self.logger.warning("Sources are still loading from file. Please wait.")
             return
 
+        # Classify every line in one regex pass over the text: stripped lines
+        # ending in ".json" may be export files, anything else is a link.
+        source_text = self.source_input.toPlainText()
+        lines = [match.groups() for match in _SOURCE_LINE_RX.finditer(source_text)]
+        existing_json = _existing_paths(
+            [json_path for json_path, _other in lines if json_path]
+        )
         command = ["download"]
-        lines = source_text.splitlines()
-        for line in lines:
-            clean_line = line.strip()
-            if not clean_line:
-                continue
-            if clean_line.endswith(".json") and os.path.exists(clean_line):
-                if " " in clean_line and os.name == "nt":
-                    command.extend(["-f", f'"{clean_line}"'])
+        command_extend = command.extend
+        quote_spaces = os.name == "nt"
+        for json_path, other in lines:
+            if json_path in existing_json:
+                if quote_spaces and " " in json_path:
+                    command_extend(["-f", f'"{json_path}"'])
                 else:
-                    command.extend(["-f", clean_line])
+                    command_extend(["-f", json_path])
             else:
-                command.extend(["-u", clean_line])
+                command_extend(["-u", json_path or other])
+
+        if len(command) == 1:
+            self.logger.error("Source input cannot be empty.")
+            return
 
         dest_path = self.dest_path_input.text().strip() or QDir.home().filePath(
             "Downloads"
         )
-        os.makedirs(dest_path, exist_ok=True)
+        # isdir() is checked on every run, so a folder deleted between runs
+        # is created again.
+        if not os.path.isdir(dest_path):
+            os.makedirs(dest_path, exist_ok=True)
 
         if " " in dest_path and os.name == "nt":
             command.extend(["-d", f'"{dest_path}"'])
         else:
             command.extend(["-d", dest_path])
 
-        if self.advanced_settings:
-            command.extend(["-l", str(self.advanced_settings["concurrent_tasks"])])
-            command.extend(["-t", str(self.advanced_settings["threads_per_task"])])
-            if self.advanced_settings["include_exts"]:
-                command.extend(["-i", self.advanced_settings["include_exts"]])
-            if self.advanced_settings["exclude_exts"]:
-                command.extend(["-e", self.advanced_settings["exclude_exts"]])
-            if self.advanced_settings["desc_order"]:
-                command.append("--desc")
-            if self.advanced_settings["skip_same"]:
-                command.append("--skip-same")
-            if self.advanced_settings["rewrite_ext"]:
-                command.append("--rewrite-ext")
-            if self.advanced_settings["group_albums"]:
-                command.append("--group")
-            if self.advanced_settings["use_takeout"]:
-                command.append("--takeout")
-            command.extend(["--pool", str(self.advanced_settings["pool_size"])])
-            if self.advanced_settings["template"]:
-                command.extend(["--template", self.advanced_settings["template"]])
-            delay_value = self.advanced_settings["delay"]
-            if delay_value > 0:
-                delay_unit = self.advanced_settings["delay_unit"]
-                command.extend(["--delay", f"{delay_value}{delay_unit}"])
+        settings = self.advanced_settings
+        if settings is not None:
+            command += (
+                "-l", str(settings.concurrent_tasks),
+                "-t", str(settings.threads_per_task),
+            )
+            for name, option in _OPTIONAL_VALUE_OPTIONS:
+                value = getattr(settings, name)
+                if value:
+                    command += (option, value)
+            command += [flag for name, flag in _BOOL_FLAGS if getattr(settings, name)]
+            command += ("--pool", str(settings.pool_size))
+            if settings.template:
+                command += ("--template", settings.template)
+            if settings.delay > 0:
+                command += ("--delay", f"{settings.delay}{settings.delay_unit}")
 
         self.worker = self.tdl_runner.run(command)
         if not self.worker:
             return
 
         self.task_started.emit(self.worker)
-        self.worker.downloadStarted.connect(self.add_download_progress_widget)
-        self.worker.downloadProgress.connect(self.update_download_progress)
-        self.worker.downloadFinished.connect(self.remove_download_progress_widget)
-        self.worker.overallProgress.connect(self.overall_progress_updated)
-        self.worker.statsUpdated.connect(self.system_stats_updated)
-        self.worker.taskFinished.connect(self.task_finished)
+        self._wire_worker(self.worker)
         self.has_started_download = True
         self.worker.start()
 
+    def _wire_worker(self, worker):
+        """Connects a download worker's signals to this tab's slots and signals."""
+        # The worker always emits from its own thread, so queue explicitly
+        # instead of letting Qt pick the connection type on every emit.
+        # downloadProgress lands in the coalescing buffer, not the view.
+        queued = Qt.ConnectionType.QueuedConnection
+        for signal_name, target_name in self._WORKER_SIGNAL_MAP:
+            getattr(worker, signal_name).connect(getattr(self, target_name), queued)
+
     def handle_resume_button(self):
         if self.tdl_runner.is_running():
             self.logger.warning("A task is already running. Please wait.")
@@ -273,12 +459,7 @@ class DownloadTab(QWidget):
             return
 
         self.task_started.emit(self.worker)
-        self.worker.downloadStarted.connect(self.add_download_progress_widget)
-        self.worker.downloadProgress.connect(self.update_download_progress)
-        self.worker.downloadFinished.connect(self.remove_download_progress_widget)
-        self.worker.overallProgress.connect(self.overall_progress_updated)
-        self.worker.statsUpdated.connect(self.system_stats_updated)
-        self.worker.taskFinished.connect(self.task_finished)
+        self._wire_worker(self.worker)
         self.has_started_download = True
         self.worker.start()
 
@@ -287,8 +468,8 @@ class DownloadTab(QWidget):
         is_this_task_running = is_running and is_active_task
 
         # Disable all controls except the main action button
-        for control in self.controls:
-            control.setEnabled(not is_running)
+        self._inputs_container.setEnabled(not is_running)
+        self.advanced_settings_button.setEnabled(not is_running)
 
         # Handle the main action button state
         self.start_download_button.setEnabled(not is_running or is_active_task)
@@ -303,29 +484,25 @@ class DownloadTab(QWidget):
         self.resume_download_button.setEnabled(not is_running and can_resume)
 
     def add_download_progress_widget(self, file_id):
-        if file_id not in self.progress_widgets:
-            progress_widget = DownloadProgressWidget(file_id)
-            self.progress_layout.insertWidget(0, progress_widget)
-            self.progress_widgets[file_id] = progress_widget
+        self.progress_model.add(file_id)
 
     def update_download_progress(self, progress_data):
-        file_id = progress_data["id"]
-        if file_id in self.progress_widgets:
-            self.progress_widgets[file_id].update_progress(progress_data)
-        else:
-            self.add_download_progress_widget(file_id)
-            self.progress_widgets[file_id].update_progress(progress_data)
+        # Keep only the latest update per file; rows are refreshed on the
+        # next flush instead of on every progress line from tdl.
+        self._pending_progress[progress_data["id"]] = progress_data
+        if not self._progress_flush_timer.isActive():
+            self._progress_flush_timer.start()
+
+    def _flush_progress(self):
+        pending, self._pending_progress = self._pending_progress, {}
+        update = self.progress_model.update
+        for file_id, progress_data in pending.items():
+            update(file_id, progress_data)
 
     def remove_download_progress_widget(self, file_id):
-        if file_id in self.progress_widgets:
-            widget = self.progress_widgets.pop(file_id)
-            widget.deleteLater()
+        self._pending_progress.pop(file_id, None)
+        self.progress_model.remove(file_id)
 
     def clear_progress_widgets(self):
-        for i in reversed(range(self.progress_layout.count())):
-            item = self.progress_layout.itemAt(i)
-            widget = item.widget()
-            if widget and not isinstance(widget, QLabel):  # Don't remove the stretch
-                widget.setParent(None)
-                widget.deleteLater()
-        self.progress_widgets.clear()
+        self.progress_model.clear()
+        self._pending_progress.clear()
@@ -21,9 +21,11 @@ class DragDropPlainTextEdit(QPlainTextEdit):
     def dropEvent(self, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
-            urls = event.mimeData().urls()
-            for url in urls:
-                if url.isLocalFile():
-                    self.appendPlainText(url.toLocalFile())
+            paths = [
+                url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()
+            ]
+            if paths:
+                # One append (one relayout) for the whole drop, not one per file.
+                self.appendPlainText("\n".join(paths))
         else:
             super().dropEvent(event)
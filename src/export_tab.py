@@ -1,3 +1,5 @@
+import os
+
 from PyQt6.QtCore import pyqtSignal, QDate, QDateTime, QTime
 from PyQt6.QtWidgets import (
     QWidget,
@@ -18,6 +20,13 @@ from PyQt6.QtWidgets import (
 )
 from src.advanced_export_dialog import AdvancedExportDialog
 
+# Fixed 'tdl chat export' command-line tokens
+_CMD_CHAT_EXPORT = ("chat", "export")
+_FLAG_TIME = ("-T", "time")
+_FLAG_ID = ("-T", "id")
+_FLAG_LAST = ("-T", "last")
+_FLAG_INPUT = "-i"
+
 
 class ExportTab(QWidget):
     task_started = pyqtSignal(object)
@@ -30,13 +39,19 @@ class ExportTab(QWidget):
         self.logger = logger
         self.worker = None
         self.advanced_export_settings = {}
-        self.controls = []
+        self._advanced_dialog = None
 
         self._init_ui()
         self._setup_connections()
 
     def _init_ui(self):
-        main_layout = QVBoxLayout(self)
+        # Every control on this tab is disabled while any task runs, so they
+        # all live in one container toggled with a single setEnabled() call.
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+        self._controls_container = QWidget()
+        outer_layout.addWidget(self._controls_container)
+        main_layout = QVBoxLayout(self._controls_container)
         main_layout.setSpacing(15)
 
         source_group = self._create_source_group()
@@ -60,23 +75,9 @@ class ExportTab(QWidget):
         main_layout.addLayout(action_button_layout)
         main_layout.addStretch()
 
-        self.controls.extend(
-            [
-                self.export_source_input,
-                self.export_type_combo,
-                self.filter_stack,
-                self.export_with_content_checkbox,
-                self.export_all_types_checkbox,
-                self.advanced_export_button,
-                self.run_export_button,
-            ]
-        )
-
     def _setup_connections(self):
         self.run_export_button.clicked.connect(self.handle_export_button)
-        self.export_type_combo.currentIndexChanged.connect(
-            self.filter_stack.setCurrentIndex
-        )
+        self.export_type_combo.currentIndexChanged.connect(self._show_filter_page)
         self.advanced_export_button.clicked.connect(self.open_advanced_export_dialog)
 
     def _create_source_group(self):
@@ -99,9 +100,32 @@ class ExportTab(QWidget):
             ["All Messages", "By Time Range", "By ID Range", "Last N Messages"]
         )
 
+        # Page 0 ("All Messages") needs no inputs. The other pages are built
+        # the first time their export type is selected; until then an empty
+        # placeholder holds their index in the stack.
         self.filter_stack = QStackedWidget()
-        self.filter_stack.addWidget(QWidget())
+        for _ in range(self.export_type_combo.count()):
+            self.filter_stack.addWidget(QWidget())
+        self._page_builders = {
+            1: self._build_time_range_page,
+            2: self._build_id_range_page,
+            3: self._build_last_n_page,
+        }
+
+        layout.addRow("Export Type:", self.export_type_combo)
+        layout.addRow(self.filter_stack)
+        return group
+
+    def _show_filter_page(self, index):
+        builder = self._page_builders.pop(index, None)
+        if builder is not None:
+            placeholder = self.filter_stack.widget(index)
+            self.filter_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.filter_stack.insertWidget(index, builder())
+        self.filter_stack.setCurrentIndex(index)
 
+    def _build_time_range_page(self):
         time_range_widget = QWidget()
         time_range_layout = QHBoxLayout(time_range_widget)
         self.from_date_edit = QDateEdit(calendarPopup=True, displayFormat="yyyy-MM-dd")
@@ -114,8 +138,9 @@ class ExportTab(QWidget):
         time_range_layout.addWidget(self.from_date_edit)
         time_range_layout.addWidget(QLabel("To:"))
         time_range_layout.addWidget(self.to_date_edit)
-        self.filter_stack.addWidget(time_range_widget)
+        return time_range_widget
 
+    def _build_id_range_page(self):
         id_range_widget = QWidget()
         id_range_layout = QHBoxLayout(id_range_widget)
         self.from_id_input = QLineEdit(placeholderText="e.g., 1")
@@ -124,19 +149,16 @@ class ExportTab(QWidget):
         id_range_layout.addWidget(self.from_id_input)
         id_range_layout.addWidget(QLabel("To ID:"))
         id_range_layout.addWidget(self.to_id_input)
-        self.filter_stack.addWidget(id_range_widget)
+        return id_range_widget
 
+    def _build_last_n_page(self):
         last_n_widget = QWidget()
         last_n_layout = QHBoxLayout(last_n_widget)
         self.last_n_spinbox = QSpinBox(minimum=1, maximum=1_000_000, value=100)
         last_n_layout.addWidget(QLabel("Number of messages:"))
         last_n_layout.addWidget(self.last_n_spinbox)
         last_n_layout.addStretch()
-        self.filter_stack.addWidget(last_n_widget)
-
-        layout.addRow("Export Type:", self.export_type_combo)
-        layout.addRow(self.filter_stack)
-        return group
+        return last_n_widget
 
     def _create_content_group(self):
         group = QGroupBox("Additional Content")
@@ -149,7 +171,11 @@ class ExportTab(QWidget):
         return group
 
     def open_advanced_export_dialog(self):
-        dialog = AdvancedExportDialog(self)
+        # Kept between clicks so its widgets are only built the first time
+        dialog = self._advanced_dialog
+        if dialog is None:
+            dialog = AdvancedExportDialog(self)
+            self._advanced_dialog = dialog
         dialog.set_settings(self.advanced_export_settings)
         if dialog.exec():
             self.advanced_export_settings = dialog.get_settings()
@@ -174,10 +200,9 @@ class ExportTab(QWidget):
             self.logger.info("Export cancelled by user.")
             return
 
-        if " " in output_path and __import__("os").name == "nt":
-            command = ["chat", "export", "-c", source, "-o", f'"{output_path}"']
-        else:
-            command = ["chat", "export", "-c", source, "-o", output_path]
+        if " " in output_path and os.name == "nt":
+            output_path = f'"{output_path}"'
+        command = [*_CMD_CHAT_EXPORT, "-c", source, "-o", output_path]
 
         export_type_index = self.export_type_combo.currentIndex()
         if export_type_index == 1:
@@ -203,21 +228,16 @@ class ExportTab(QWidget):
                 )
                 return
 
-            command.extend(
-                [
-                    "-T",
-                    "time",
-                    "-i",
-                    f"{int(from_dt.toSecsSinceEpoch())},{int(to_dt.toSecsSinceEpoch())}",
-                ]
-            )
+            # toSecsSinceEpoch() already returns ints.
+            time_range = f"{from_dt.toSecsSinceEpoch()},{to_dt.toSecsSinceEpoch()}"
+            command.extend((*_FLAG_TIME, _FLAG_INPUT, time_range))
         elif export_type_index == 2:
             from_id = self.from_id_input.text().strip() or "0"
             to_id = self.to_id_input.text().strip() or "0"
-            command.extend(["-T", "id", "-i", f"{from_id},{to_id}"])
+            command.extend((*_FLAG_ID, _FLAG_INPUT, f"{from_id},{to_id}"))
         elif export_type_index == 3:
             n_messages = self.last_n_spinbox.value()
-            command.extend(["-T", "last", "-i", str(n_messages)])
+            command.extend((*_FLAG_LAST, _FLAG_INPUT, str(n_messages)))
         if self.export_with_content_checkbox.isChecked():
             command.append("--with-content")
         if self.export_all_types_checkbox.isChecked():
@@ -265,11 +285,7 @@ class ExportTab(QWidget):
         """Enable or disable controls based on task status."""
         # In this tab, we disable all controls if any task is running,
         # as export is a lighter operation and shouldn't run concurrently.
-        for control in self.controls:
-            control.setEnabled(not is_running)
-
-        # The main button should also be disabled if a task is running.
-        self.run_export_button.setEnabled(not is_running)
+        self._controls_container.setEnabled(not is_running)
 
     def set_export_source(self, source):
         self.export_source_input.setText(source)
@@ -1,98 +1,130 @@
+import re
+from collections import OrderedDict
+from functools import lru_cache
+
 from PyQt6.QtCore import QRegularExpression
 from PyQt6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont
 
 
+@lru_cache(maxsize=None)
+def compile_regex(pattern):
+    """Returns an optimized QRegularExpression, built once per pattern per process."""
+    regex = QRegularExpression(pattern)
+    # Compile (and JIT, where available) now rather than on the first match.
+    regex.optimize()
+    return regex
+
+
+def _make_format(color, bold=False, italic=False):
+    text_format = QTextCharFormat()
+    text_format.setForeground(QColor(color))
+    if bold:
+        text_format.setFontWeight(QFont.Weight.Bold)
+    if italic:
+        text_format.setFontItalic(True)
+    return text_format
+
+
+def _word_alternation(words):
+    """Returns one whole-word pattern matching any of the given words."""
+    return r"\b(?:" + "|".join(map(re.escape, words)) + r")\b"
+
+
+def _build_highlight_rules():
+    rules = []
+
+    # Numeric literals
+    number_format = _make_format("#6897BB")
+    rules.append((compile_regex(r"\b[0-9]+\b"), number_format))
+
+    # String literals
+    string_format = _make_format("#6A8759")
+    rules.append((compile_regex(r"'.*?'"), string_format))
+    rules.append((compile_regex(r'".*?"'), string_format))
+    rules.append((compile_regex(r"`.*?`"), string_format))
+
+    # Keywords
+    keyword_format = _make_format("#CC7832", bold=True)
+    keywords = [
+        "let", "in", "and", "or", "not", "matches", "true", "false", "nil"
+    ]
+    rules.append((compile_regex(_word_alternation(keywords)), keyword_format))
+
+    # Built-in functions
+    function_format = _make_format("#FFC66D")
+    functions = [
+        "trim", "trimPrefix", "trimSuffix", "upper", "lower", "split",
+        "splitAfter", "replace", "repeat", "indexOf", "lastIndexOf",
+        "hasPrefix", "hasSuffix", "now", "duration", "date", "timezone",
+        "max", "min", "abs", "ceil", "floor", "round", "all", "any", "one",
+        "none", "map", "filter", "find", "findIndex", "findLast",
+        "findLastIndex", "groupBy", "count", "concat", "flatten", "uniq",
+        "join", "reduce", "sum", "mean", "median", "first", "last", "take",
+        "reverse", "sort", "sortBy", "keys", "values", "type", "int",
+        "float", "string", "toJSON", "fromJSON", "toBase64", "fromBase64",
+        "toPairs", "fromPairs", "len", "get", "bitand", "bitor", "bitxor",
+        "bitnand", "bitnot", "bitshl", "bitshr", "bitushr"
+    ]
+    rules.append((compile_regex(_word_alternation(functions)), function_format))
+
+    # Built-in variables
+    variable_format = _make_format("#9876AA")
+    variables = ["Message", "From"]
+    rules.append((compile_regex(_word_alternation(variables)), variable_format))
+
+    # Operators
+    operator_format = _make_format("#A9B7C6")
+    operators = [
+        r"\+", r"-", r"\*", r"/", r"%", r"\^", r"\*\*", r"==", r"!=", r"<",
+        r">", r"<=", r">=", r"&&", r"\|\|", r"!", r"\?:", r"\?\?", r"\|"
+    ]
+    for op in operators:
+        rules.append((compile_regex(op), operator_format))
+
+    # Comments
+    comment_format = _make_format("#808080", italic=True)
+    rules.append((compile_regex(r"//[^\n]*"), comment_format))
+    return tuple(rules)
+
+
+# The rules are identical for every editor, so they are built once, on the
+# first highlighter construction, and shared.
+_HIGHLIGHT_RULES = None
+_MULTI_LINE_COMMENT_FORMAT = None
+_COMMENT_START_EXPRESSION = compile_regex(r"/\*")
+_COMMENT_END_EXPRESSION = compile_regex(r"\*/")
+
+
 class ExprSyntaxHighlighter(QSyntaxHighlighter):
+    MAX_HIGHLIGHT_LEN = 10000
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
-
-        # Numeric literals
-        number_format = QTextCharFormat()
-        number_format.setForeground(QColor("#6897BB"))
-        self.highlighting_rules.append((QRegularExpression(r"\b[0-9]+\b"), number_format))
-
-        # String literals
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor("#6A8759"))
-        self.highlighting_rules.append((QRegularExpression(r"'.*?'"), string_format))
-        self.highlighting_rules.append((QRegularExpression(r'".*?"'), string_format))
-        self.highlighting_rules.append((QRegularExpression(r"`.*?`"), string_format))
-
-        # Keywords
-        keyword_format = QTextCharFormat()
-        keyword_format.setForeground(QColor("#CC7832"))
-        keyword_format.setFontWeight(QFont.Weight.Bold)
-        keywords = [
-            "let", "in", "and", "or", "not", "matches", "true", "false", "nil"
-        ]
-        for word in keywords:
-            self.highlighting_rules.append(
-                (QRegularExpression(rf"\b{word}\b"), keyword_format)
-            )
-
-        # Built-in functions
-        function_format = QTextCharFormat()
-        function_format.setForeground(QColor("#FFC66D"))
-        functions = [
-            "trim", "trimPrefix", "trimSuffix", "upper", "lower", "split",
-            "splitAfter", "replace", "repeat", "indexOf", "lastIndexOf",
-            "hasPrefix", "hasSuffix", "now", "duration", "date", "timezone",
-            "max", "min", "abs", "ceil", "floor", "round", "all", "any", "one",
-            "none", "map", "filter", "find", "findIndex", "findLast",
-            "findLastIndex", "groupBy", "count", "concat", "flatten", "uniq",
-            "join", "reduce", "sum", "mean", "median", "first", "last", "take",
-            "reverse", "sort", "sortBy", "keys", "values", "type", "int",
-            "float", "string", "toJSON", "fromJSON", "toBase64", "fromBase64",
-            "toPairs", "fromPairs", "len", "get", "bitand", "bitor", "bitxor",
-            "bitnand", "bitnot", "bitshl", "bitshr", "bitushr"
-        ]
-        for word in functions:
-            self.highlighting_rules.append(
-                (QRegularExpression(rf"\b{word}\b"), function_format)
-            )
-
-        # Built-in variables
-        variable_format = QTextCharFormat()
-        variable_format.setForeground(QColor("#9876AA"))
-        variables = ["Message", "From"]
-        for word in variables:
-            self.highlighting_rules.append(
-                (QRegularExpression(rf"\b{word}\b"), variable_format)
-            )
-
-        # Operators
-        operator_format = QTextCharFormat()
-        operator_format.setForeground(QColor("#A9B7C6"))
-        operators = [
-            r"\+", r"-", r"\*", r"/", r"%", r"\^", r"\*\*", r"==", r"!=", r"<",
-            r">", r"<=", r">=", r"&&", r"\|\|", r"!", r"\?:", r"\?\?", r"\|"
-        ]
-        for op in operators:
-            self.highlighting_rules.append(
-                (QRegularExpression(op), operator_format)
-            )
-
-        # Comments
-        comment_format = QTextCharFormat()
-        comment_format.setForeground(QColor("#808080"))
-        comment_format.setFontItalic(True)
-        self.highlighting_rules.append((QRegularExpression(r"//[^\n]*"), comment_format))
-        self.multi_line_comment_format = QTextCharFormat()
-        self.multi_line_comment_format.setForeground(QColor("#808080"))
-        self.multi_line_comment_format.setFontItalic(True)
-        self.comment_start_expression = QRegularExpression(r"/\*")
-        self.comment_end_expression = QRegularExpression(r"\*/")
+        global _HIGHLIGHT_RULES, _MULTI_LINE_COMMENT_FORMAT
+        if _HIGHLIGHT_RULES is None:
+            _HIGHLIGHT_RULES = _build_highlight_rules()
+            _MULTI_LINE_COMMENT_FORMAT = _make_format("#808080", italic=True)
+        self.highlighting_rules = _HIGHLIGHT_RULES
+        self.multi_line_comment_format = _MULTI_LINE_COMMENT_FORMAT
+        self.comment_start_expression = _COMMENT_START_EXPRESSION
+        self.comment_end_expression = _COMMENT_END_EXPRESSION
 
     def highlightBlock(self, text):
-        # First, apply all single-line rules
+        # First, apply all single-line rules, unless the block is so long
+        # (e.g. a pasted one-liner) that matching every rule would stall the UI
+        if len(text) <= self.MAX_HIGHLIGHT_LEN:
+            self._apply_rules(text)
+        # Then, handle multi-line comments, which can span across blocks
+        self._apply_multi_line_comments(text)
+
+    def _apply_rules(self, text):
         for pattern, format in self.highlighting_rules:
             match_iterator = pattern.globalMatch(text)
             while match_iterator.hasNext():
                 match = match_iterator.next()
                 self.setFormat(match.capturedStart(), match.capturedLength(), format)
 
-        # Then, handle multi-line comments, which can span across blocks
+    def _apply_multi_line_comments(self, text):
         self.setCurrentBlockState(0)
         current_pos = 0
 
@@ -133,3 +165,35 @@ class ExprSyntaxHighlighter(QSyntaxHighlighter):
                 length = end_index - start_index
                 self.setFormat(start_index, length, self.multi_line_comment_format)
                 current_pos = end_index
+
+
+class CachedExprSyntaxHighlighter(ExprSyntaxHighlighter):
+    """
+    An ExprSyntaxHighlighter that memoizes the single-line rule matches per
+    block text, so re-highlighting the same lines (e.g. reloaded presets)
+    skips the regex scan. The cache is shared by all instances.
+    """
+
+    MAX_CACHE_SIZE = 512
+    _range_cache = OrderedDict()
+
+    def _apply_rules(self, text):
+        ranges = self._range_cache.get(text)
+        if ranges is None:
+            ranges = []
+            for index, (pattern, _format) in enumerate(self.highlighting_rules):
+                match_iterator = pattern.globalMatch(text)
+                while match_iterator.hasNext():
+                    match = match_iterator.next()
+                    ranges.append(
+                        (match.capturedStart(), match.capturedLength(), index)
+                    )
+            self._range_cache[text] = ranges
+            if len(self._range_cache) > self.MAX_CACHE_SIZE:
+                self._range_cache.popitem(last=False)
+        else:
+            self._range_cache.move_to_end(text)
+
+        rules = self.highlighting_rules
+        for start, length, index in ranges:
+            self.setFormat(start, length, rules[index][1])
@@ -15,6 +15,16 @@ from PyQt6.QtWidgets import (
 from src.advanced_forward_dialog import AdvancedForwardDialog
 from src.select_chat_dialog import SelectChatDialog
 
+# Advanced settings passed as "<option> <value>" when non-empty...
+_VALUE_OPTIONS = (("mode", "--mode"), ("edit_expression", "--edit"))
+# ...and boolean settings passed as bare flags when set.
+_BOOL_FLAGS = (
+    ("dry_run", "--dry-run"),
+    ("silent", "--silent"),
+    ("no_group", "--single"),
+    ("desc_order", "--desc"),
+)
+
 
 class ForwardTab(QWidget):
     task_started = pyqtSignal(object)
@@ -29,6 +39,8 @@ class ForwardTab(QWidget):
         self.worker = None
         self.advanced_settings = {}
         self.controls = []
+        self._select_chat_dialog = None
+        self._advanced_dialog = None
 
         self._init_ui()
         self._setup_connections()
@@ -76,20 +88,33 @@ class ForwardTab(QWidget):
         self.select_chat_button.clicked.connect(self._open_select_chat_dialog)
 
     def _open_select_chat_dialog(self):
-        dialog = SelectChatDialog(self.tdl_runner, self.logger, self)
-        dialog.chat_selected.connect(self.dest_chat_input.setText)
+        # The dialog is kept between clicks so the chat list is not refetched
+        # from tdl every time it opens
+        dialog = self._select_chat_dialog
+        if dialog is None:
+            dialog = SelectChatDialog(self.tdl_runner, self.logger, self)
+            dialog.chat_selected.connect(self.dest_chat_input.setText)
+            self._select_chat_dialog = dialog
+        else:
+            dialog.refresh_if_stale()
         dialog.exec()
 
     def open_advanced_settings_dialog(self):
-        dialog = AdvancedForwardDialog(
-            tdl_runner=self.tdl_runner,
-            settings_manager=self.settings_manager,
-            logger=self.logger,
-            parent=self,
-        )
+        # Kept between clicks so its widgets are only built the first time
+        dialog = self._advanced_dialog
+        if dialog is None:
+            dialog = AdvancedForwardDialog(
+                tdl_runner=self.tdl_runner,
+                settings_manager=self.settings_manager,
+                logger=self.logger,
+                parent=self,
+            )
+            self._advanced_dialog = dialog
         if dialog.exec():
             self.advanced_settings = dialog.get_settings()
-            self.logger.info(f"Advanced forward settings saved: {self.advanced_settings}")
+            self.logger.info(
+                "Advanced forward settings saved: %s", self.advanced_settings
+            )
         else:
             self.logger.info("Advanced forward settings dialog cancelled.")
 
@@ -136,36 +161,30 @@ class ForwardTab(QWidget):
 
         command = ["forward"]
 
-        sources = source_text.splitlines()
-        for source in sources:
-            clean_source = source.strip()
-            if not clean_source:
-                continue
-
-            # tdl automatically detects if the source is a link or a JSON file,
-            # so we can use the --from flag for both.
-            if " " in clean_source and os.name == "nt":
-                command.extend(["--from", f'"{clean_source}"'])
-            else:
-                command.extend(["--from", clean_source])
+        # tdl automatically detects if the source is a link or a JSON file,
+        # so we can use the --from flag for both.
+        quote_spaces = os.name == "nt"
+        sources = [s for s in map(str.strip, source_text.splitlines()) if s]
+        command += [
+            arg
+            for source in sources
+            for arg in (
+                "--from",
+                f'"{source}"' if quote_spaces and " " in source else source,
+            )
+        ]
 
         dest_chat = self.dest_chat_input.text().strip()
         if dest_chat:
-            command.extend(["--to", dest_chat])
-
-        if self.advanced_settings:
-            if self.advanced_settings.get("mode"):
-                command.extend(["--mode", self.advanced_settings["mode"]])
-            if self.advanced_settings.get("edit_expression"):
-                command.extend(["--edit", self.advanced_settings["edit_expression"]])
-            if self.advanced_settings["dry_run"]:
-                command.append("--dry-run")
-            if self.advanced_settings["silent"]:
-                command.append("--silent")
-            if self.advanced_settings["no_group"]:
-                command.append("--single")
-            if self.advanced_settings["desc_order"]:
-                command.append("--desc")
+            command += ("--to", dest_chat)
+
+        settings = self.advanced_settings
+        if settings:
+            for name, option in _VALUE_OPTIONS:
+                value = settings.get(name)
+                if value:
+                    command += (option, value)
+            command += [flag for name, flag in _BOOL_FLAGS if settings[name]]
 
         self.worker = self.tdl_runner.run(command)
         if not self.worker:
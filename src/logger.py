@@ -1,30 +1,135 @@
+import collections
 import logging
+import logging.handlers
 import os
-from PyQt6.QtCore import QObject, pyqtSignal
+import queue
+import threading
+import time
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal, pyqtSlot
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+# How often queued GUI log records are handed to the GUI in one batch.
+LOG_BATCH_INTERVAL_MS = 50
+# Lines kept by the GUI log view; the log file keeps the full history.
+LOG_VIEW_MAX_BLOCKS = 5000
+# Write buffer for app.log, and how old buffered DEBUG output may get before
+# the next record flushes it.
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+LOG_FILE_FLUSH_INTERVAL = 1.0
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A file handler that writes through a large buffer. INFO and above are
+    flushed right away, so they are on disk even if the app then goes idle.
+    High-volume DEBUG output is only flushed by the next INFO+ record, by a
+    record arriving LOG_FILE_FLUSH_INTERVAL seconds after the last flush,
+    or on close.
+    """
+
+    def __init__(self, filename, mode="a", encoding=None):
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode=mode, encoding=encoding)
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+        )
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+
+        now = time.monotonic()
+        if (
+            record.levelno >= logging.INFO
+            or now - self._last_flush >= LOG_FILE_FLUSH_INTERVAL
+        ):
+            self.flush()
+            self._last_flush = now
+
+
+class _FastFormatter(logging.Formatter):
+    """A formatter that formats each second's timestamp only once."""
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_second = None
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = super().formatTime(record, datefmt)
+            self._cached_second = second
+        return self._cached_time
+
+
+class _PassThroughQueueHandler(logging.handlers.QueueHandler):
+    """
+    A QueueHandler that enqueues records as they are. The stock prepare()
+    formats every record on the logging thread to make it picklable, which
+    an in-process queue does not need; formatting is left to the handlers
+    on the listener thread.
+    """
+
+    def prepare(self, record):
+        return record
 
 
 class QtLogHandler(logging.Handler):
     """
-    A custom logging handler that emits a PyQt signal for each log record.
+    A custom logging handler that collects formatted records for the GUI.
+    The owning Logger drains them shortly after the first one arrives and
+    emits them as one batch.
     """
 
-    def __init__(self, log_signal):
+    def __init__(self, on_first_pending=None):
         super().__init__()
-        self.log_signal = log_signal
+        self._pending = collections.deque()
+        self._pending_lock = threading.Lock()
+        # Called from the emitting thread when a record lands in an empty queue
+        self._on_first_pending = on_first_pending
 
     def emit(self, record):
-        """Emits a signal with the formatted log message and level name."""
+        """Queues the formatted log message and level name."""
         msg = self.format(record)
-        self.log_signal.emit(msg, record.levelname)
+        with self._pending_lock:
+            was_empty = not self._pending
+            self._pending.append((msg, record.levelname))
+        if was_empty and self._on_first_pending is not None:
+            self._on_first_pending()
+
+    def take_pending(self):
+        """Returns and clears the (message, level) pairs queued so far."""
+        with self._pending_lock:
+            batch = list(self._pending)
+            self._pending.clear()
+        return batch
 
 
 class Logger(QObject):
     """
     A centralized logger for the application.
     It logs to a file and emits a signal for the GUI to display messages.
+    The file receives the full history, while the GUI view only keeps the
+    most recent LOG_VIEW_MAX_BLOCKS lines.
     """
 
-    log_signal = pyqtSignal(str, str)  # message, level
+    log_batch_signal = pyqtSignal(list)  # [(message, level), ...]
+    # Emitted from the listener thread when GUI records start to queue up
+    _gui_records_pending = pyqtSignal()
 
     def __init__(self, settings_manager):
         super().__init__()
@@ -39,42 +144,87 @@ class Logger(QObject):
 
         # 2. Create a file handler
         log_file_path = os.path.join(self.settings_manager.config_dir, "app.log")
-        file_handler = logging.FileHandler(log_file_path, mode="a", encoding="utf-8")
+        file_handler = BufferedFileHandler(log_file_path, mode="a", encoding="utf-8")
+        self._file_handler = file_handler
         file_handler.setLevel(logging.DEBUG)
 
         # 3. Create a Qt signal handler
-        qt_handler = QtLogHandler(self.log_signal)
+        qt_handler = QtLogHandler(on_first_pending=self._gui_records_pending.emit)
+        self._qt_handler = qt_handler
         # Only show INFO and above in the GUI log by default, unless debug mode is on
         gui_log_level = (
             logging.DEBUG if self.settings_manager.get("debug_mode") else logging.INFO
         )
         qt_handler.setLevel(gui_log_level)
 
-        # 4. Create a formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        # 4. Create formatters; the GUI one reuses its timestamp within a second
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+        qt_handler.setFormatter(_FastFormatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+
+        # 5. Route records through a queue so callers only pay for a put();
+        # formatting, file I/O and signal emission happen on the listener thread
+        self._queue = queue.Queue(-1)
+        self._queue_handler = _PassThroughQueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+        self._listener = logging.handlers.QueueListener(
+            self._queue, file_handler, qt_handler, respect_handler_level=True
+        )
+        self._listener.start()
+
+        # 6. Hand GUI records over in batches instead of one signal per record.
+        # The timer is only armed once records are waiting, so an idle app
+        # gets no wake-ups from it.
+        self._batch_timer = QTimer(self)
+        self._batch_timer.setSingleShot(True)
+        self._batch_timer.setInterval(LOG_BATCH_INTERVAL_MS)
+        self._batch_timer.timeout.connect(self._flush_gui_batch)
+        self._gui_records_pending.connect(
+            self._arm_batch_timer, Qt.ConnectionType.QueuedConnection
         )
-        file_handler.setFormatter(formatter)
-        qt_handler.setFormatter(formatter)
-
-        # 5. Add handlers to the logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(qt_handler)
-
-    def debug(self, message):
-        self.logger.debug(message)
-
-    def info(self, message):
-        self.logger.info(message)
-
-    def warning(self, message):
-        self.logger.warning(message)
-
-    def error(self, message):
-        self.logger.error(message)
 
-    def critical(self, message):
-        self.logger.critical(message)
+    @pyqtSlot()
+    def _arm_batch_timer(self):
+        if not self._batch_timer.isActive():
+            self._batch_timer.start()
+
+    @pyqtSlot()
+    def _flush_gui_batch(self):
+        batch = self._qt_handler.take_pending()
+        if batch:
+            self.log_batch_signal.emit(batch)
+
+    def shutdown(self):
+        """
+        Stops the listener thread after flushing any queued records. Records
+        logged afterwards go straight to the file handler instead of into a
+        queue nobody reads.
+        """
+        if self._listener is not None:
+            self.logger.addHandler(self._file_handler)
+            self.logger.removeHandler(self._queue_handler)
+            self._listener.stop()
+            self._listener = None
+            self._file_handler.flush()
+        self._batch_timer.stop()
+        self._flush_gui_batch()
+
+    def isEnabledFor(self, level):
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message, *args, **kwargs):
+        self.logger.debug(message, *args, **kwargs)
+
+    def info(self, message, *args, **kwargs):
+        self.logger.info(message, *args, **kwargs)
+
+    def warning(self, message, *args, **kwargs):
+        self.logger.warning(message, *args, **kwargs)
+
+    def error(self, message, *args, **kwargs):
+        self.logger.error(message, *args, **kwargs)
+
+    def critical(self, message, *args, **kwargs):
+        self.logger.critical(message, *args, **kwargs)
 
 
 # Create a single, globally accessible instance
@@ -1,6 +1,7 @@
+import logging
 import sys
-import threading
 import re
+import weakref
 from PyQt6.QtCore import QThread, pyqtSignal
 
 # pywinpty is only available on Windows
@@ -14,8 +15,29 @@ if sys.platform == "win32":
         PtyProcess = None
         pywinpty = None
 
+# Read whatever the PTY has available, up to this many characters per call.
+# pywinpty only offers str reads and decodes each one incrementally, so
+# chunks are collected as str and joined at line/prompt boundaries.
+_PTY_READ_SIZE = 4096
+_QR_TRIGGER = "Scan QR code"
+# Covers most common cases of ANSI escape sequences
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+_PROMPT_RE = re.compile(r"\? (.*):")
+# Prompt keyword -> prompt type, checked in order
+_PROMPT_KEYWORDS = (
+    ("phone number", "phone"),
+    ("code", "code"),
+    ("password", "password"),
+)
+
 
 class LoginWorker(QThread):
+    """
+    Drives an interactive `tdl login` in a PTY. It runs on its own thread
+    rather than the shared I/O pool: the login blocks for as long as the
+    user takes to answer, and must not hold a pool thread that long.
+    """
+
     warning_detected = pyqtSignal(str)
     status_update = pyqtSignal(str)
     prompt_for_input = pyqtSignal(str, str)
@@ -23,6 +45,12 @@ class LoginWorker(QThread):
     login_success = pyqtSignal()
     login_failed = pyqtSignal(str)
 
+    # Workers started from the GUI thread, so stop_all() can end their PTY
+    # children before the app exits without Python-level cleanup.
+    _started = weakref.WeakSet()
+    # How long stop_all() waits for each worker thread to wind down
+    _STOP_WAIT_MS = 3000
+
     def __init__(
         self, tdl_path, namespace, settings_manager, logger, mode="code", parent=None
     ):
@@ -35,12 +63,21 @@ class LoginWorker(QThread):
         self.pty_process = None
         self._is_stopped = False
         self._login_success_emitted = False
-
-    def _strip_ansi(self, text):
-        """Removes ANSI escape codes from a string."""
-        # This regex covers most common cases of ANSI escape sequences
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape.sub("", text)
+        # Read once; also decides whether per-chunk PTY tracing is worth its cost
+        self._debug_mode = bool(settings_manager.get("debug_mode", False))
+        self._info_enabled = logger.isEnabledFor(logging.INFO)
+
+    def start(self):
+        LoginWorker._started.add(self)
+        super().start()
+
+    @classmethod
+    def stop_all(cls):
+        """Stops every login still in progress and terminates its tdl child."""
+        for worker in list(cls._started):
+            if worker.isRunning():
+                worker.stop()
+                worker.wait(cls._STOP_WAIT_MS)
 
     def run(self):
         # On non-Windows platforms, pywinpty is not available.
@@ -56,27 +93,26 @@ class LoginWorker(QThread):
             return
 
         command = [self.tdl_path, "login", "-T", self.mode, "--ns", self.namespace]
-        if self.settings_manager.get("debug_mode", False):
+        if self._debug_mode:
             command.append("--debug")
 
         try:
             # Spawn the process in a pseudo-terminal
             self.pty_process = pywinpty.spawn(command)
-            self.logger.info(f"Started login process in PTY: {' '.join(command)}")
+            if self._info_enabled:
+                self.logger.info("Started login process in PTY: %s", " ".join(command))
 
+            # This already runs on the worker thread, so read the output directly
             if self.mode == "code":
                 # With PTY, stdout and stderr are combined, so we only need one reader
-                output_thread = threading.Thread(target=self._read_pty_output)
+                self._read_pty_output()
             elif self.mode == "qr":
                 # The QR mode might also benefit from PTY, using the same reader
-                output_thread = threading.Thread(target=self._read_pty_output_for_qr)
+                self._read_pty_output_for_qr()
             else:
                 self.login_failed.emit(f"Invalid login mode: {self.mode}")
                 return
 
-            output_thread.start()
-            output_thread.join()  # Wait for the reader to finish
-
             if self.pty_process.isalive():
                 self.pty_process.wait()
 
@@ -94,85 +130,114 @@ class LoginWorker(QThread):
 
     def _read_pty_output(self):
         """Reads and processes the combined stdout/stderr from the PTY."""
-        buffer = ""
-        prompt_regex = re.compile(r"\? (.*):")
+        buffer_parts = []
 
-        while self.pty_process.isalive() and not self._is_stopped:
+        while not self._is_stopped:
             try:
-                char = self.pty_process.read(1)
+                chunk = self.pty_process.read(_PTY_READ_SIZE)
             except EOFError:
                 break  # Process exited
+            if not chunk:
+                # Only ask the PTY whether the process is alive when it is idle
+                if not self.pty_process.isalive():
+                    break
+                continue
 
-            buffer += char
-            # Clean the buffer to remove ANSI codes before processing
-            clean_buffer = self._strip_ansi(buffer)
-            line = clean_buffer.strip()
-
-            self.logger.debug(f"[PTY] {repr(char)} -> Buffer: '{line}'")
-
-            # Check for prompts in the cleaned buffer
-            prompt_match = prompt_regex.search(line)
-            if prompt_match:
-                self.logger.debug(f"[PTY-MATCH] Prompt matched on line: '{line}'")
-                prompt_text = prompt_match.group(1).strip()
-                prompt_type = "unknown"
-
-                if "phone number" in prompt_text.lower():
-                    prompt_type = "phone"
-                elif "code" in prompt_text.lower():
-                    prompt_type = "code"
-                elif "password" in prompt_text.lower():
-                    prompt_type = "password"
-
-                # The warning might also be in the line, extract it
-                if "warn:" in line.lower():
-                    self.warning_detected.emit(line.split("?")[0].strip())
-
-                self.prompt_for_input.emit(prompt_type, prompt_text)
-                buffer = ""  # Clear buffer after successful match
+            buffer_parts.append(chunk)
+            if self._debug_mode:
+                self.logger.debug("[PTY] %r", chunk)
+            # A line can only complete on '\n' and a prompt only on ':'
+            has_newline = "\n" in chunk
+            has_colon = ":" in chunk
+            if not has_newline and not has_colon:
                 continue
 
-            # Check for other messages on newlines in the raw buffer
-            if "\n" in buffer:
+            buffer = "".join(buffer_parts)
+            if has_newline:
                 parts = buffer.split("\n")
                 buffer = parts[-1]  # Keep the last, possibly incomplete part
 
-                for part in parts[:-1]:
-                    clean_part = self._strip_ansi(part)
+                # ANSI codes are stripped once per completed line
+                for clean_part in [_ANSI_RE.sub("", part) for part in parts[:-1]]:
                     line_to_check = clean_part.strip()
                     if not line_to_check:
                         continue
 
-                    self.logger.debug(f"[PTY-LINE] {line_to_check}")
-                    if "login successfully!" in line_to_check.lower():
+                    prompt_match = _PROMPT_RE.search(line_to_check)
+                    if prompt_match:
+                        self._emit_prompt(line_to_check, prompt_match)
+                        continue
+
+                    self.logger.debug("[PTY-LINE] %s", line_to_check)
+                    low = line_to_check.lower()
+                    if "login successfully!" in low:
                         if not self._login_success_emitted:
                             self.login_success.emit()
                             self._login_success_emitted = True
                         return  # End thread
-                    if "sending code..." in line_to_check.lower():
+                    if "sending code..." in low:
                         self.status_update.emit("Sending verification code...")
 
+            # Check for prompts in the cleaned, still unterminated line
+            if has_colon:
+                line = _ANSI_RE.sub("", buffer).strip()
+                prompt_match = _PROMPT_RE.search(line)
+                if prompt_match:
+                    self._emit_prompt(line, prompt_match)
+                    buffer = ""  # Clear buffer after successful match
+            buffer_parts = [buffer] if buffer else []
+
+    def _emit_prompt(self, line, prompt_match):
+        """Emits the input prompt (and any warning preceding it) found on a line."""
+        self.logger.debug("[PTY-MATCH] Prompt matched on line: '%s'", line)
+        prompt_text = prompt_match.group(1).strip()
+        prompt_text_lower = prompt_text.lower()
+        prompt_type = "unknown"
+        for keyword, kind in _PROMPT_KEYWORDS:
+            if keyword in prompt_text_lower:
+                prompt_type = kind
+                break
+
+        # The warning might also be in the line, extract it
+        if "warn:" in line.lower():
+            self.warning_detected.emit(line.split("?")[0].strip())
+
+        self.prompt_for_input.emit(prompt_type, prompt_text)
+
     def _read_pty_output_for_qr(self):
         # A simplified reader for QR code mode.
         # We do NOT strip ANSI codes here, as they are used to render the QR code.
-        buffer = ""
-        while self.pty_process.isalive() and not self._is_stopped:
+        buffer_parts = []
+        # Tail of the previous chunk, so a trigger split across reads is found
+        overlap = ""
+        triggered = False
+        while not self._is_stopped:
             try:
-                char = self.pty_process.read(1)
-                buffer += char
-                # Check for the trigger phrase in the raw buffer
-                if "Scan QR code" in buffer:
-                    # Emit the raw buffer to preserve ANSI-based QR code formatting
-                    self.qr_code_ready.emit(buffer)
+                chunk = self.pty_process.read(_PTY_READ_SIZE)
             except EOFError:
                 break
+            if not chunk:
+                # Only ask the PTY whether the process is alive when it is idle
+                if not self.pty_process.isalive():
+                    break
+                continue
+            buffer_parts.append(chunk)
+            if not triggered:
+                # Check for the trigger phrase in the newly read output only
+                triggered = _QR_TRIGGER in overlap + chunk
+                overlap = chunk[-(len(_QR_TRIGGER) - 1) :]
+            if triggered:
+                # Emit the raw buffer to preserve ANSI-based QR code formatting
+                buffer = "".join(buffer_parts)
+                buffer_parts = [buffer]  # Keep the joined text for the next read
+                self.qr_code_ready.emit(buffer)
 
     def send_input(self, text):
         if self.pty_process and self.pty_process.isalive():
             try:
                 # The new PTY API expects a string, not bytes.
                 self.pty_process.write(text + "\r\n")
-                self.logger.debug(f"[PTY-WRITE] Wrote: {text}")
+                self.logger.debug("[PTY-WRITE] Wrote: %s", text)
             except Exception as e:
                 self.login_failed.emit(f"Failed to write to PTY process: {e}")
 
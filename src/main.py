@@ -1,34 +1,107 @@
+import logging
+import os
 import sys
-from src.tdl_manager import TdlManager
-from src.worker import InitialSetupWorker
 from src.settings_manager import SettingsManager
 from src.logger import initialize_logger
 from src.theme_manager import ThemeManager
+from src.worker_pool import IO_POOL, shutdown_io_pool
+from src.login_worker import LoginWorker
 
 # --- UI Imports ---
 from PyQt6.QtWidgets import QApplication, QMessageBox, QProgressDialog
 from PyQt6.QtCore import Qt, QTimer
 
 
+def _theme_override(argv):
+    """
+    Returns a theme forced by the TDL_THEME environment variable or a
+    --theme=<name> argument, or None to use the saved setting.
+    """
+    theme_name = os.environ.get("TDL_THEME")
+    if theme_name:
+        return theme_name
+    for arg in argv[1:]:
+        if arg.startswith("--theme="):
+            return arg.partition("=")[2]
+    return None
+
+
+# How long exit waits for a stopped tdl task or download thread to finish
+# (and, for a tdl task that ignores terminate, for the kill to take effect)
+_STOP_WAIT_MS = 5000
+
+
 class AppController:
-    def __init__(self, app, settings_manager, theme_name="light"):
+    def __init__(
+        self,
+        app,
+        settings_manager,
+        theme_name="light",
+        manager=None,
+        tdl_check=None,
+        stylesheet=None,
+    ):
         self.app = app
         self.settings_manager = settings_manager
         self.theme_name = theme_name
+        # Full stylesheet still to be applied once the first window is up
+        self.stylesheet = stylesheet
         self.main_window = None
+        self.setup_worker = None
         self.logger = initialize_logger(self.settings_manager)
+        self.manager = manager
+        # Future of manager.check_for_tdl(), started early by main()
+        self._tdl_check = tdl_check
 
     def start(self):
         self.logger.info("Application starting...")
-        self.manager = TdlManager()
-        tdl_path, status = self.manager.check_for_tdl()
+        if self.manager is None:
+            from src.tdl_manager import TdlManager
+
+            self.manager = TdlManager()
+        if self._tdl_check is None:
+            self._tdl_check = IO_POOL.submit(self.manager.check_for_tdl)
+        # Resolved here, on the GUI thread, so any dialogs below are safe
+        tdl_path, status = self._tdl_check.result()
 
         if status == "not_found":
             self.run_initial_setup()
         else:
             self.launch_main_window(tdl_path)
 
+    def stop_running_task(self):
+        """Stops a still-running tdl task so no child process outlives the app."""
+        tdl_runner = self.main_window.tdl_runner if self.main_window else None
+        if tdl_runner is not None and tdl_runner.is_running():
+            worker = tdl_runner.worker
+            tdl_runner.stop()
+            if not worker.wait(_STOP_WAIT_MS):
+                # tdl ignored the terminate request; don't let it block exit
+                process = worker.process
+                if process is not None and process.poll() is None:
+                    process.kill()
+                worker.wait(_STOP_WAIT_MS)
+
+    def stop_downloads(self):
+        """
+        Cancels a tdl download still in progress (first-run setup or update)
+        so no truncated file is left behind by the hard exit.
+        """
+        setup_worker = self.setup_worker
+        if setup_worker is not None and setup_worker.isRunning():
+            self.manager.cancel()
+            setup_worker.wait(_STOP_WAIT_MS)
+        update_manager = self.main_window.update_manager if self.main_window else None
+        if update_manager is not None:
+            update_manager.stop()
+
+    def _apply_full_stylesheet(self):
+        if self.stylesheet is not None:
+            self.app.setStyleSheet(self.stylesheet)
+            self.stylesheet = None
+
     def run_initial_setup(self):
+        self._apply_full_stylesheet()
         reply = QMessageBox.information(
             None,
             "TDL Not Found",
@@ -45,6 +118,9 @@ class AppController:
         self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
         self.progress_dialog.setWindowTitle("Setup")
 
+        # Only needed on first run, when tdl has to be downloaded
+        from src.worker import InitialSetupWorker
+
         self.setup_worker = InitialSetupWorker(self.manager)
         self.setup_worker.progress.connect(self.update_progress)
         self.setup_worker.success.connect(self.on_setup_success)
@@ -86,27 +162,56 @@ class AppController:
             settings_manager=self.settings_manager,
             logger=self.logger,
             theme=self.theme_name,
+            defer_tabs=True,
         )
         self.main_window.show()
+        QTimer.singleShot(0, self._apply_full_stylesheet)
 
 
 def main():
     app = QApplication(sys.argv)
+    # Only the tdl lookup (filesystem and PATH probing) runs on the I/O pool,
+    # overlapping with the stylesheet work below; imports stay on this thread
+    from src.tdl_manager import TdlManager
+
+    tdl_manager = TdlManager()
+    tdl_check = IO_POOL.submit(tdl_manager.check_for_tdl)
 
     settings_manager = SettingsManager()
     theme_manager = ThemeManager()
 
-    theme_name = settings_manager.get("theme", "light")
+    # A per-launch override wins over the saved theme, if it names a known one
+    theme_name = _theme_override(sys.argv)
+    if theme_name not in theme_manager.themes:
+        theme_name = settings_manager.get("theme", "light")
+    # Only the first-paint rules go in now; the controller applies the full
+    # sheet right after the first window is shown
+    app.setStyleSheet(theme_manager.get_critical_stylesheet(theme_name))
     stylesheet = theme_manager.get_stylesheet(theme_name)
-    app.setStyleSheet(stylesheet)
 
-    controller = AppController(app, settings_manager, theme_name)
+    controller = AppController(
+        app, settings_manager, theme_name, tdl_manager, tdl_check, stylesheet
+    )
+    # Connected in this order so the task, any login in progress and any tdl
+    # download are stopped before the log is flushed
+    app.aboutToQuit.connect(controller.stop_running_task)
+    app.aboutToQuit.connect(LoginWorker.stop_all)
+    app.aboutToQuit.connect(controller.stop_downloads)
+    app.aboutToQuit.connect(controller.logger.shutdown)
 
     # Use a QTimer to start the controller after the event loop has started.
     # This ensures that the initial QMessageBox and QProgressDialog are properly displayed.
     QTimer.singleShot(10, controller.start)
 
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    # Child processes and threads were stopped on aboutToQuit. Drop queued
+    # pool jobs and flush every log handler, then skip the interpreter's
+    # module teardown
+    shutdown_io_pool()
+    logging.shutdown()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,11 @@ import json
 import urllib.request
 import subprocess
 import re
-import os
-import sys
 from PyQt6.QtCore import (
     QUrl,
+    QTimer,
+    QSignalBlocker,
+    pyqtSlot,
 )
 from PyQt6.QtWidgets import (
     QMainWindow,
@@ -31,6 +32,8 @@ from PyQt6.QtGui import (
 )
 
 from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from src.settings_dialog import SettingsDialog
 from src.utility_dialog import UtilityDialog
 from src.update_manager import UpdateDialog, UpdateManager
@@ -41,10 +44,25 @@ from src.export_tab import ExportTab
 from src.chats_tab import ChatsTab
 from src.upload_tab import UploadTab
 from src.forward_tab import ForwardTab
+from src.logger import LOG_VIEW_MAX_BLOCKS
+
+# (error, warning) log colours per theme; unknown themes use the light ones.
+_LOG_COLORS = {
+    "dark": ("#FF5555", "#FFC107"),
+    "nord": ("#BF616A", "#EBCB8B"),  # nord11, nord13
+    "solarized-dark": ("#dc322f", "#b58900"),  # red, yellow
+    "solarized-light": ("#dc322f", "#b58900"),  # red, yellow
+    "light": ("#D32F2F", "#F57F17"),
+}
+
+# Titles of the task tabs, in display order; the Log tab always follows them.
+_TASK_TAB_TITLES = ("Download", "Upload", "Forward", "Export", "Chats")
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, app, tdl_path, settings_manager, logger, theme="light"):
+    def __init__(
+        self, app, tdl_path, settings_manager, logger, theme="light", defer_tabs=False
+    ):
         super().__init__()
         self.app = app
         self.tdl_path = tdl_path
@@ -60,22 +78,11 @@ class MainWindow(QMainWindow):
         self.active_task_tab_index = -1
         self.original_tab_text = ""
         self.advanced_settings = {}
+        self._defer_tabs = defer_tabs
 
-        if self.theme == "dark":
-            self.error_color = QColor("#FF5555")
-            self.warn_color = QColor("#FFC107")
-        elif self.theme == "nord":
-            self.error_color = QColor("#BF616A")  # nord11
-            self.warn_color = QColor("#EBCB8B")  # nord13
-        elif self.theme == "solarized-dark":
-            self.error_color = QColor("#dc322f")  # red
-            self.warn_color = QColor("#b58900")  # yellow
-        elif self.theme == "solarized-light":
-            self.error_color = QColor("#dc322f")  # red
-            self.warn_color = QColor("#b58900")  # yellow
-        else:  # light theme
-            self.error_color = QColor("#D32F2F")
-            self.warn_color = QColor("#F57F17")
+        error_hex, warn_hex = _LOG_COLORS.get(self.theme, _LOG_COLORS["light"])
+        self.error_color = QColor(error_hex)
+        self.warn_color = QColor(warn_hex)
 
         self._init_ui()
         self._setup_connections()
@@ -102,7 +109,22 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
 
-        # Create and add tabs
+        if self._defer_tabs:
+            # Show the window with empty pages first and build the real tabs
+            # on the first pass of the event loop
+            for title in _TASK_TAB_TITLES:
+                self.tabs.addTab(QWidget(), title)
+            QTimer.singleShot(0, self._build_real_tabs)
+        else:
+            self._create_task_tabs()
+            for tab, title in zip(self._task_tabs(), _TASK_TAB_TITLES):
+                self.tabs.addTab(tab, title)
+
+        # The log tab is always built up front so early messages are kept
+        self.log_tab = self._create_log_tab()
+        self.tabs.addTab(self.log_tab, "Log")
+
+    def _create_task_tabs(self):
         self.download_tab = DownloadTab(
             self.tdl_runner, self.settings_manager, self.logger
         )
@@ -112,14 +134,31 @@ class MainWindow(QMainWindow):
         )
         self.export_tab = ExportTab(self.tdl_runner, self.settings_manager, self.logger)
         self.chats_tab = ChatsTab(self.tdl_runner, self.settings_manager, self.logger)
-        self.log_tab = self._create_log_tab()
 
-        self.tabs.addTab(self.download_tab, "Download")
-        self.tabs.addTab(self.upload_tab, "Upload")
-        self.tabs.addTab(self.forward_tab, "Forward")
-        self.tabs.addTab(self.export_tab, "Export")
-        self.tabs.addTab(self.chats_tab, "Chats")
-        self.tabs.addTab(self.log_tab, "Log")
+    def _task_tabs(self):
+        return (
+            self.download_tab,
+            self.upload_tab,
+            self.forward_tab,
+            self.export_tab,
+            self.chats_tab,
+        )
+
+    @pyqtSlot()
+    def _build_real_tabs(self):
+        """Replaces the placeholder pages with the real task tabs."""
+        self._create_task_tabs()
+        current = self.tabs.currentIndex()
+        with QSignalBlocker(self.tabs):
+            for index, (tab, title) in enumerate(
+                zip(self._task_tabs(), _TASK_TAB_TITLES)
+            ):
+                placeholder = self.tabs.widget(index)
+                self.tabs.removeTab(index)
+                self.tabs.insertTab(index, tab, title)
+                placeholder.deleteLater()
+            self.tabs.setCurrentIndex(current)
+        self._connect_tab_signals()
 
     def _collect_global_controls(self):
         """Collects all controls that should be disabled when a task is running."""
@@ -131,8 +170,12 @@ class MainWindow(QMainWindow):
 
     def _setup_connections(self):
         """Connects all signals to slots."""
-        self.logger.log_signal.connect(self.append_log)
+        self.logger.log_batch_signal.connect(self.append_log_batch)
+        if not self._defer_tabs:
+            self._connect_tab_signals()
 
+    def _connect_tab_signals(self):
+        """Connects the task tab signals; runs once the tabs are built."""
         # Download Tab Connections
         self.download_tab.task_started.connect(self.on_task_started)
         self.download_tab.task_finished.connect(self._task_finished)
@@ -174,6 +217,8 @@ class MainWindow(QMainWindow):
         self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
         self.log_output.setObjectName("LogOutput")
+        # Old lines drop off the view; app.log keeps the full history
+        self.log_output.setMaximumBlockCount(LOG_VIEW_MAX_BLOCKS)
 
         button_layout = QHBoxLayout()
         open_log_button = QPushButton("Open Log File Location")
@@ -254,33 +299,52 @@ class MainWindow(QMainWindow):
                 self.active_task_tab_index = -1
                 self.original_tab_text = ""
 
-    def append_log(self, message, level):
-        cursor = self.log_output.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-
-        char_format = QTextCharFormat()
-        default_color = self.palette().color(QPalette.ColorRole.Text)
-        char_format.setForeground(default_color)
-
-        if level == "WARNING":
-            char_format.setForeground(self.warn_color)
-        elif level in ["ERROR", "CRITICAL"]:
-            char_format.setForeground(self.error_color)
-
-        cursor.setCharFormat(char_format)
-        # We only insert the message, as the logger already formats it with timestamp/level
-        cursor.insertText(message + "\n")
-
-        # Reset format for next entries
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.setCharFormat(QTextCharFormat())
-        self.log_output.setTextCursor(cursor)
-
-        # Show important messages in the status bar
-        if level in ["INFO", "WARNING", "ERROR", "CRITICAL"]:
-            # Strip the timestamp and level for a cleaner status bar message
-            status_message = " - ".join(message.split(" - ")[2:])
-            self.statusBar().showMessage(status_message, 5000)
+    @pyqtSlot(list)
+    def append_log_batch(self, batch):
+        """Appends a batch of (message, level) log records to the log view."""
+        log_output = self.log_output
+        # Suspend repaints, signals and undo history while the batch goes in
+        undo_enabled = log_output.isUndoRedoEnabled()
+        log_output.setUpdatesEnabled(False)
+        log_output.blockSignals(True)
+        log_output.setUndoRedoEnabled(False)
+        try:
+            cursor = log_output.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+
+            default_color = self.palette().color(QPalette.ColorRole.Text)
+            # Consecutive records of the same level share a format, so each run is
+            # inserted with a single call
+            for level, records in groupby(batch, key=itemgetter(1)):
+                char_format = QTextCharFormat()
+                if level == "WARNING":
+                    char_format.setForeground(self.warn_color)
+                elif level in ["ERROR", "CRITICAL"]:
+                    char_format.setForeground(self.error_color)
+                else:
+                    char_format.setForeground(default_color)
+
+                cursor.setCharFormat(char_format)
+                # We only insert the messages, as the logger already formats them
+                # with timestamp/level
+                cursor.insertText("".join(message + "\n" for message, _ in records))
+
+            # Reset format for next entries
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            cursor.setCharFormat(QTextCharFormat())
+            log_output.setTextCursor(cursor)
+        finally:
+            log_output.setUndoRedoEnabled(undo_enabled)
+            log_output.blockSignals(False)
+            log_output.setUpdatesEnabled(True)
+
+        # Show the latest important message in the status bar
+        for message, level in reversed(batch):
+            if level in ["INFO", "WARNING", "ERROR", "CRITICAL"]:
+                # Strip the timestamp and level for a cleaner status bar message
+                status_message = " - ".join(message.split(" - ")[2:])
+                self.statusBar().showMessage(status_message, 5000)
+                break
 
     def _create_menu_bar(self):
         menu_bar = self.menuBar()
@@ -533,7 +597,7 @@ class MainWindow(QMainWindow):
                 return
             values.update(dialog.get_values())
 
-        command = config["base_cmd"][:]
+        command = list(config["base_cmd"])
         for field in config["fields"]:
             value = values.get(field["name"])
             if value:
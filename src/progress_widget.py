@@ -1,4 +1,16 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QRect, QSize, Qt
+from PyQt6.QtGui import QFont, QFontMetrics, QPalette
+from PyQt6.QtWidgets import (
+    QApplication,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QProgressBar,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionProgressBar,
+)
 
 
 class DownloadProgressWidget(QWidget):
@@ -64,3 +76,164 @@ class DownloadProgressWidget(QWidget):
         self.size_label.setText(f"Size: {data['size_info']}")
         self.eta_label.setText(f"ETA: {data['eta']}")
         self.speed_label.setText(f"Speed: {data['speed']}")
+
+
+class DownloadProgressModel(QAbstractListModel):
+    """
+    A list model of in-flight downloads, newest first. Each row is a file ID
+    plus the latest progress data parsed from tdl (or None before the first
+    update); painting is left to DownloadProgressDelegate.
+    """
+
+    ProgressRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Stored oldest first so appends don't shift existing rows; row r in
+        # the view maps to _items[-1 - r].
+        self._items = []
+        self._positions = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        file_id, progress_data = self._items[-1 - index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return file_id
+        if role == self.ProgressRole:
+            return progress_data
+        return None
+
+    def __contains__(self, file_id):
+        return file_id in self._positions
+
+    def _row(self, position):
+        return len(self._items) - 1 - position
+
+    def add(self, file_id):
+        if file_id in self._positions:
+            return
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._positions[file_id] = len(self._items)
+        self._items.append([file_id, None])
+        self.endInsertRows()
+
+    def update(self, file_id, progress_data):
+        position = self._positions.get(file_id)
+        if position is None:
+            self.add(file_id)
+            position = self._positions[file_id]
+        self._items[position][1] = progress_data
+        index = self.index(self._row(position))
+        self.dataChanged.emit(index, index, [self.ProgressRole])
+
+    def remove(self, file_id):
+        position = self._positions.pop(file_id, None)
+        if position is None:
+            return
+        row = self._row(position)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._items[position]
+        for later_id, _data in self._items[position:]:
+            self._positions[later_id] -= 1
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self._items = []
+        self._positions = {}
+        self.endResetModel()
+
+
+class DownloadProgressDelegate(QStyledItemDelegate):
+    """
+    Paints a DownloadProgressModel row the way DownloadProgressWidget lays it
+    out (bold filename, progress bar, size/ETA/speed line) without creating
+    any widgets, so only visible rows cost anything.
+    """
+
+    MARGIN = 3
+    SPACING = 2
+    BAR_HEIGHT = 18
+    STATS_POINT_SIZE = 8
+
+    def _fonts(self, option):
+        title_font = QFont(option.font)
+        title_font.setBold(True)
+        stats_font = QFont(option.font)
+        stats_font.setPointSize(self.STATS_POINT_SIZE)
+        return title_font, stats_font
+
+    def sizeHint(self, option, index):
+        title_font, stats_font = self._fonts(option)
+        height = (
+            2 * self.MARGIN
+            + QFontMetrics(title_font).height()
+            + self.BAR_HEIGHT
+            + QFontMetrics(stats_font).height()
+            + 2 * self.SPACING
+        )
+        return QSize(option.rect.width(), height + self.MARGIN)
+
+    def paint(self, painter, option, index):
+        progress_data = index.data(DownloadProgressModel.ProgressRole)
+        file_id = index.data(Qt.ItemDataRole.DisplayRole)
+        title_font, stats_font = self._fonts(option)
+        title_height = QFontMetrics(title_font).height()
+        stats_height = QFontMetrics(stats_font).height()
+
+        painter.save()
+        # Leave a gap below each row, like the widget's margin-bottom.
+        frame = option.rect.adjusted(0, 0, -1, -1 - self.MARGIN)
+        # Colours come from the view's palette so rows follow the active theme.
+        painter.setPen(option.palette.color(QPalette.ColorRole.Mid))
+        painter.drawRoundedRect(frame, 4, 4)
+
+        content = frame.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        top = content.top()
+
+        painter.setFont(title_font)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        title_rect = QRect(content.left(), top, content.width(), title_height)
+        painter.drawText(
+            title_rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            QFontMetrics(title_font).elidedText(
+                file_id, Qt.TextElideMode.ElideMiddle, content.width()
+            ),
+        )
+        top += title_height + self.SPACING
+
+        bar = QStyleOptionProgressBar()
+        bar.rect = QRect(content.left(), top, content.width(), self.BAR_HEIGHT)
+        bar.palette = option.palette
+        bar.state = option.state | QStyle.StateFlag.State_Horizontal
+        bar.minimum = 0
+        bar.maximum = 100
+        bar.progress = int(progress_data["percent"]) if progress_data else 0
+        bar.text = f"{bar.progress}%"
+        bar.textVisible = True
+        bar.textAlignment = Qt.AlignmentFlag.AlignCenter
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ProgressBar, bar, painter, option.widget)
+        top += self.BAR_HEIGHT + self.SPACING
+
+        if progress_data:
+            size_text = f"Size: {progress_data['size_info']}"
+            eta_text = f"ETA: {progress_data['eta']}"
+            speed_text = f"Speed: {progress_data['speed']}"
+        else:
+            size_text, eta_text, speed_text = "Size: N/A", "ETA: N/A", "Speed: N/A"
+        painter.setFont(stats_font)
+        painter.setPen(option.palette.color(QPalette.ColorRole.PlaceholderText))
+        stats_rect = QRect(content.left(), top, content.width(), stats_height)
+        for text, alignment in (
+            (size_text, Qt.AlignmentFlag.AlignLeft),
+            (eta_text, Qt.AlignmentFlag.AlignHCenter),
+            (speed_text, Qt.AlignmentFlag.AlignRight),
+        ):
+            painter.drawText(stats_rect, alignment | Qt.AlignmentFlag.AlignVCenter, text)
+        painter.restore()
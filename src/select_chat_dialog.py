@@ -1,4 +1,5 @@
 import json
+import time
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtWidgets import (
     QDialog,
@@ -13,7 +14,10 @@ from PyQt6.QtWidgets import (
     QMessageBox,
 )
 
-from src.config import CHAT_NAME_COLORS
+from src.config import CHAT_NAME_COLORS, N_CHAT_COLORS
+
+# A reused dialog reloads its chat list once it is older than this (seconds).
+_CHATS_STALE_AFTER = 300
 
 
 class SelectChatDialog(QDialog):
@@ -24,6 +28,7 @@ class SelectChatDialog(QDialog):
         self.tdl_runner = tdl_runner
         self.logger = logger
         self.worker = None
+        self._loaded_at = None
 
         self._init_ui()
         self._setup_connections()
@@ -87,6 +92,14 @@ class SelectChatDialog(QDialog):
         self.worker.taskFinished.connect(self._on_load_finished)
         self.worker.start()
 
+    def refresh_if_stale(self):
+        """Reloads the chat list if it never loaded or is out of date."""
+        if (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > _CHATS_STALE_AFTER
+        ):
+            self._load_chats()
+
     def _on_load_finished(self, exit_code):
         if exit_code != 0:
             self.logger.error("Failed to load chat list.")
@@ -104,14 +117,15 @@ class SelectChatDialog(QDialog):
                 row_position = self.chats_table.rowCount()
                 self.chats_table.insertRow(row_position)
 
-                name = chat.get("visible_name", "")
-                type = chat.get("type", "")
-                id_str = str(chat.get("id", ""))
-                username = chat.get("username", "")
+                g = chat.get
+                name = g("visible_name", "")
+                type = g("type", "")
+                id_str = str(g("id", ""))
+                username = g("username", "")
 
                 name_item = QTableWidgetItem(name)
                 if id_str:
-                    color_index = hash(id_str) % len(CHAT_NAME_COLORS)
+                    color_index = hash(id_str) % N_CHAT_COLORS
                     name_item.setForeground(CHAT_NAME_COLORS[color_index])
 
                 # Store the ID in a custom role for later retrieval
@@ -119,13 +133,19 @@ class SelectChatDialog(QDialog):
                 id_item.setData(Qt.ItemDataRole.UserRole, id_str)
 
                 self.chats_table.setItem(row_position, 0, name_item)
-                self.chats_table.setItem(row_position, 1, QTableWidgetItem(type))
-                self.chats_table.setItem(row_position, 2, QTableWidgetItem(username))
+                # Missing items already render as empty cells.
+                if type:
+                    self.chats_table.setItem(row_position, 1, QTableWidgetItem(type))
+                if username:
+                    self.chats_table.setItem(
+                        row_position, 2, QTableWidgetItem(username)
+                    )
                 # We store the ID in the first item's data
                 self.chats_table.item(row_position, 0).setData(Qt.ItemDataRole.UserRole, id_str)
 
 
             self.chats_table.setSortingEnabled(True)
+            self._loaded_at = time.monotonic()
             self.logger.info(
                 f"Successfully populated select-chat dialog with {len(chats)} chats."
             )
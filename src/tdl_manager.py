@@ -8,7 +8,14 @@ import zipfile
 import tempfile
 
 
+class _DownloadCancelled(Exception):
+    pass
+
+
 class TdlManager:
+    # Set by cancel() to abort download_and_install_tdl before it writes to bin
+    _cancelled = False
+
     def __init__(self):
         self.bin_dir = os.path.join(os.path.dirname(__file__), "..", "bin")
         os.makedirs(self.bin_dir, exist_ok=True)
@@ -30,6 +37,10 @@ class TdlManager:
 
         return None, "not_found"
 
+    def cancel(self):
+        """Stops a running download_and_install_tdl at the next download block."""
+        self._cancelled = True
+
     def download_and_install_tdl(self, progress_callback=None):
         """
         Downloads and installs the latest version of tdl for Windows.
@@ -60,6 +71,8 @@ class TdlManager:
             temp_zip_path = os.path.join(tempfile.gettempdir(), file_name)
 
             def _reporthook(count, block_size, total_size):
+                if self._cancelled:
+                    raise _DownloadCancelled()
                 if progress_callback and total_size > 0:
                     percent = int(count * block_size * 100 / total_size)
                     progress_callback(percent, 100)
@@ -67,6 +80,9 @@ class TdlManager:
             urllib.request.urlretrieve(download_url, temp_zip_path, _reporthook)
 
             # 4. Extract tdl.exe from the zip file
+            if self._cancelled:
+                os.remove(temp_zip_path)
+                return None, "Download cancelled."
             if progress_callback:
                 progress_callback(0, 100)
 
@@ -92,6 +108,10 @@ class TdlManager:
             else:
                 return None, "tdl.exe not found at the expected path after installation."
 
+        except _DownloadCancelled:
+            if os.path.exists(temp_zip_path):
+                os.remove(temp_zip_path)
+            return None, "Download cancelled."
         except urllib.error.URLError as e:
             return None, f"A network error occurred: {e.reason}"
         except (json.JSONDecodeError, KeyError) as e:
@@ -1,8 +1,66 @@
 import os
+import re
+
+# Bundled .qss themes, resolved next to this module so lookup does not
+# depend on the working directory the app was started from.
+STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles")
+
+
+# Comments, which are dropped, and quoted strings or url(...) values, which
+# are copied verbatim; only the text between them is minified.
+_QSS_TOKEN_RE = re.compile(r"/\*.*?\*/|(\"[^\"]*\"|'[^']*'|url\([^)]*\))", re.S)
+_QSS_SPACE_RE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};:,])\s*")
+
+
+# Widgets drawn in the main window's first paint. Rules whose selectors only
+# name these types make up the critical subset applied before it is shown.
+_CRITICAL_WIDGETS = frozenset(
+    {
+        "QWidget",
+        "QMainWindow",
+        "QDialog",
+        "QFrame",
+        "QPushButton",
+        "QLabel",
+        "QTabWidget",
+        "QTabBar",
+        "QMenuBar",
+        "QStatusBar",
+    }
+)
+_QSS_RULE_RE = re.compile(r"([^{}]+)\{[^{}]*\}")
+# Type selector at the start of each compound selector
+_QSS_TYPE_RE = re.compile(r"(?:^|[\s>+~])([A-Za-z_]\w*)")
+
+
+def _minify_code(text):
+    return _QSS_PUNCT_SPACE_RE.sub(r"\1", _QSS_SPACE_RE.sub(" ", text))
+
+
+def _minify_qss(text):
+    """Strips comments and insignificant whitespace so Qt parses less text."""
+    parts = []
+    code = []  # Text since the last verbatim token, comments left out
+    start = 0
+    for match in _QSS_TOKEN_RE.finditer(text):
+        code.append(text[start : match.start()])
+        start = match.end()
+        if match.group(1):
+            parts.append(_minify_code("".join(code)))
+            parts.append(match.group(1))
+            code = []
+    code.append(text[start:])
+    parts.append(_minify_code("".join(code)))
+    return "".join(parts).strip()
 
 
 class ThemeManager:
-    def __init__(self, styles_dir="src/styles"):
+    # (mtime, minified stylesheet text) by file path, shared by all instances
+    # so a theme is only read and minified again after its file changes.
+    _stylesheet_cache = {}
+
+    def __init__(self, styles_dir=STYLES_DIR):
         self.styles_dir = styles_dir
         self.themes = self._discover_themes()
 
@@ -26,7 +84,28 @@ class ThemeManager:
 
         filepath = self.themes[theme_name]
         try:
-            with open(filepath, "r") as f:
-                return f.read()
+            mtime = os.stat(filepath).st_mtime_ns
+            cached_mtime, stylesheet = self._stylesheet_cache.get(filepath, (None, ""))
+            if cached_mtime != mtime:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    stylesheet = _minify_qss(f.read())
+                self._stylesheet_cache[filepath] = (mtime, stylesheet)
         except FileNotFoundError:
             return ""
+        return stylesheet
+
+    def get_critical_stylesheet(self, theme_name):
+        """
+        Returns the rules of the theme that only target first-paint widgets,
+        in their original order.
+        """
+        rules = []
+        for match in _QSS_RULE_RE.finditer(self.get_stylesheet(theme_name)):
+            selectors = match.group(1).split(",")
+            selector_types = [_QSS_TYPE_RE.findall(selector) for selector in selectors]
+            if all(
+                types and _CRITICAL_WIDGETS.issuperset(types)
+                for types in selector_types
+            ):
+                rules.append(match.group(0))
+        return "".join(rules)
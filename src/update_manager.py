@@ -21,6 +21,11 @@ class Downloader:
         self.url = url
         self.dest_folder = dest_folder
         self.progress_callback = progress_callback
+        self._cancelled = False
+
+    def cancel(self):
+        """Makes run() stop after the chunk it is currently reading."""
+        self._cancelled = True
 
     def run(self):
         try:
@@ -37,6 +42,8 @@ class Downloader:
                     downloaded_size = 0
                     chunk_size = 8192
                     while True:
+                        if self._cancelled:
+                            return None, "Download cancelled."
                         chunk = response.read(chunk_size)
                         if not chunk:
                             break
@@ -66,11 +73,14 @@ class UpdateWorker(QObject):
         self.version = version
         self.current_tdl_path = current_tdl_path
         self.temp_dir = temp_dir
+        self.downloader = Downloader(self.url, self.temp_dir, self.progress.emit)
+
+    def cancel(self):
+        self.downloader.cancel()
 
     def run(self):
         try:
-            downloader = Downloader(self.url, self.temp_dir, self.progress.emit)
-            download_path, err = downloader.run()
+            download_path, err = self.downloader.run()
             if err:
                 self.error.emit(err)
                 return
@@ -130,6 +140,9 @@ class UpdateManager(QObject):
     error = pyqtSignal(str)
     finished = pyqtSignal(str, str)
 
+    # How long stop() waits for the download thread to notice the cancel
+    STOP_WAIT_MS = 5000
+
     def __init__(self, url, version, current_tdl_path):
         super().__init__()
         self.url = url
@@ -163,6 +176,19 @@ class UpdateManager(QObject):
     def start(self):  # pragma: no cover - backward compatibility shim
         return self.start_download()
 
+    def stop(self):
+        """
+        Cancels a download in progress and waits for its thread, so the app
+        can exit without leaving a half-written archive behind.
+        """
+        thread = self.thread
+        if not (thread and thread.isRunning()):
+            return
+        self.worker.cancel()
+        thread.quit()
+        if thread.wait(self.STOP_WAIT_MS):
+            self._teardown(cleanup_temp=True)
+
     def _on_worker_error(self, message):
         self.error.emit(message)
         self._teardown(cleanup_temp=True)
@@ -246,6 +246,11 @@ class UploadTab(QWidget):
             widget.deleteLater()
 
     def clear_progress_widgets(self):
+        # Tear everything down inside one layout/paint pass instead of
+        # invalidating the layout once per removed widget.
+        container = self.progress_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        self.progress_layout.setEnabled(False)
         for i in reversed(range(self.progress_layout.count())):
             item = self.progress_layout.itemAt(i)
             if item and item.widget():
@@ -253,6 +258,8 @@ class UploadTab(QWidget):
                 if not isinstance(widget, QLabel):
                     widget.setParent(None)
                     widget.deleteLater()
+        self.progress_layout.setEnabled(True)
+        container.setUpdatesEnabled(True)
         self.progress_widgets.clear()
 
     def on_task_finished(self, exit_code):
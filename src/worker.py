@@ -1,5 +1,13 @@
+import json
 import subprocess
 import re
+import sys
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to the stdlib parser.
+    orjson = None
+
 from PyQt6.QtCore import QThread, pyqtSignal
 
 # Regex for lines containing per-file progress updates.
@@ -36,10 +44,37 @@ TDL_STATS_RE = re.compile(
 )
 
 
+def parse_chat_rows(json_data):
+    """
+    Parses the JSON output of 'tdl chat ls' into (name, type, id, username)
+    row tuples. Raises json.JSONDecodeError on malformed input (orjson's
+    error type subclasses it). Chat types come from a small fixed set, so
+    they are interned and every row shares the same string objects.
+    """
+    chats = orjson.loads(json_data) if orjson is not None else json.loads(json_data)
+    intern = sys.intern
+    rows = []
+    append = rows.append
+    for chat in chats:
+        g = chat.get  # Bind once per row instead of once per field.
+        append(
+            (
+                g("visible_name", ""),
+                intern(g("type", "")),
+                str(g("id", "")),
+                g("username", ""),
+            )
+        )
+    return rows
+
+
 class Worker(QThread):
     taskFinished = pyqtSignal(int)
     taskFailedWithLog = pyqtSignal(int, str)
     taskData = pyqtSignal(str)
+    # Parsed 'tdl chat ls' rows, produced on the worker thread
+    chatsParsed = pyqtSignal(list)
+    chatsParseFailed = pyqtSignal()
 
     # New signals for structured data
     downloadStarted = pyqtSignal(str)
@@ -204,6 +239,8 @@ class Worker(QThread):
                     # If the task succeeded and a listener is connected to taskData, emit the raw output.
                     if self.receivers(self.taskData) > 0:
                         self.taskData.emit("\n".join(raw_output))
+                    if self.receivers(self.chatsParsed) > 0:
+                        self._emit_chat_rows(raw_output)
                 else:
                     overall_return_code = return_code
                     log_output = "\n".join(full_log)
@@ -238,6 +275,15 @@ class Worker(QThread):
 
         self.taskFinished.emit(overall_return_code)
 
+    def _emit_chat_rows(self, raw_output):
+        try:
+            rows = parse_chat_rows("\n".join(raw_output))
+        except json.JSONDecodeError:
+            self.logger.error("Failed to parse JSON data from 'tdl chat ls' command.")
+            self.chatsParseFailed.emit()
+            return
+        self.chatsParsed.emit(rows)
+
     def stop(self):
         self._is_stopped = True
         if self.process and self.process.poll() is None:
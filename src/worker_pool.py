@@ -0,0 +1,18 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# A small, shared pool for mostly idle blocking I/O (reading, writing and
+# waiting on child processes), so each such job does not need its own thread.
+IO_POOL_MAX_WORKERS = 3
+
+IO_POOL = ThreadPoolExecutor(
+    max_workers=IO_POOL_MAX_WORKERS, thread_name_prefix="tdl-gui-io"
+)
+
+
+def shutdown_io_pool():
+    """Cancels jobs that have not started yet, without waiting for the rest."""
+    if sys.version_info >= (3, 9):
+        IO_POOL.shutdown(wait=False, cancel_futures=True)
+    else:  # cancel_futures is new in Python 3.9
+        IO_POOL.shutdown(wait=False)
@@ -18,25 +18,33 @@ class TestAdvancedSettingsDialog(unittest.TestCase):
 
     def setUp(self):
         self.dialog = AdvancedSettingsDialog()
+        self.dialog._ensure_ui()
+        self.dialog._ensure_filters_naming_tab()
+
+    def test_get_settings_without_building_filters_tab(self):
+        dialog = AdvancedSettingsDialog()
+        settings = dialog.get_settings()
+        self.assertIsNone(dialog.filters_naming_tab)
+        self.assertEqual(settings, self.dialog.get_settings())
 
     def test_get_settings_default_template(self):
         """Tests that the 'Default: ' prefix is correctly stripped."""
         # The default selection is the one with the prefix
         settings = self.dialog.get_settings()
-        self.assertEqual(settings['template'], "{{ .DialogID }}_{{ .MessageID }}_{{ filenamify .FileName }}")
+        self.assertEqual(settings.template, "{{ .DialogID }}_{{ .MessageID }}_{{ filenamify .FileName }}")
 
     def test_get_settings_other_predefined_template(self):
         """Tests a predefined template without any prefix."""
         self.dialog.template_combo.setCurrentText("{{ .FileName }}")
         settings = self.dialog.get_settings()
-        self.assertEqual(settings['template'], "{{ .FileName }}")
+        self.assertEqual(settings.template, "{{ .FileName }}")
 
     def test_get_settings_custom_template(self):
         """Tests the 'Custom...' template option."""
         self.dialog.template_combo.setCurrentText("Custom...")
         self.dialog.template_input.setText("MyCustom/{{.FileName}}")
         settings = self.dialog.get_settings()
-        self.assertEqual(settings['template'], "MyCustom/{{.FileName}}")
+        self.assertEqual(settings.template, "MyCustom/{{.FileName}}")
 
     def test_get_settings_other_values(self):
         """Tests that other settings are also retrieved correctly."""
@@ -45,9 +53,9 @@ class TestAdvancedSettingsDialog(unittest.TestCase):
         self.dialog.include_ext_input.setText("mkv,mp4")
 
         settings = self.dialog.get_settings()
-        self.assertEqual(settings['concurrent_tasks'], 10)
-        self.assertEqual(settings['skip_same'], False)
-        self.assertEqual(settings['include_exts'], "mkv,mp4")
+        self.assertEqual(settings.concurrent_tasks, 10)
+        self.assertEqual(settings.skip_same, False)
+        self.assertEqual(settings.include_exts, "mkv,mp4")
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+
+# Add src to path to allow importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+app = QApplication.instance()
+if app is None:
+    app = QApplication(sys.argv)
+
+from src.chats_tab import ChatsModel
+from src.config import CHAT_NAME_COLORS
+
+class TestChatsModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = ChatsModel()
+        self.rows = [
+            ("Alice", "private", "1001", "alice"),
+            ("News", "channel", "2002", ""),
+            ("No ID", "group", "", ""),
+        ]
+        self.model.set_rows(self.rows)
+
+    def _color(self, row, column=0):
+        return self.model.data(
+            self.model.index(row, column), Qt.ItemDataRole.ForegroundRole
+        )
+
+    def test_display_data(self):
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.columnCount(), 4)
+        self.assertEqual(
+            self.model.data(self.model.index(1, ChatsModel.ID_COLUMN)), "2002"
+        )
+        self.assertEqual(
+            self.model.headerData(0, Qt.Orientation.Horizontal), "Name"
+        )
+
+    def test_name_color_per_chat_id(self):
+        self.assertIn(self._color(0), CHAT_NAME_COLORS)
+        self.assertIn(self._color(1), CHAT_NAME_COLORS)
+        # Chats without an ID and columns other than the name are not coloured
+        self.assertIsNone(self._color(2))
+        self.assertIsNone(self._color(0, column=1))
+
+    def test_color_stays_with_chat_across_refreshes(self):
+        alice_color = self._color(0)
+        self.model.set_rows([("Other", "group", "3003", "")] + self.rows)
+        self.assertEqual(self._color(1), alice_color)
+
+if __name__ == '__main__':
+    unittest.main()
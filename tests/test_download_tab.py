@@ -1,7 +1,9 @@
 import os
+import shutil
 import sys
+import tempfile
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 # Add src to path to allow importing
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -12,7 +14,7 @@ app = QApplication.instance()
 if app is None:
     app = QApplication(sys.argv)
 
-from src.download_tab import DownloadTab
+from src.download_tab import DownloadTab, _FileLoadRunnable, _existing_paths
 
 class TestDownloadTab(unittest.TestCase):
 
@@ -54,5 +56,118 @@ class TestDownloadTab(unittest.TestCase):
         self.assertTrue(self.tab.dest_path_input.isEnabled())
         self.assertTrue(self.tab.advanced_settings_button.isEnabled())
 
+    def _run_download(self, source_text, dest_path):
+        """Clicks Start Download and returns the command passed to tdl."""
+        self.mock_tdl_runner.is_running.return_value = False
+        self.mock_tdl_runner.run.return_value = None
+        self.tab.source_input.setPlainText(source_text)
+        self.tab.dest_path_input.setText(dest_path)
+        self.tab.handle_download_button()
+        return self.mock_tdl_runner.run.call_args[0][0]
+
+    def test_sources_split_into_links_and_existing_json_files(self):
+        """Existing .json paths become -f, links and missing files become -u."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        export_path = os.path.join(temp_dir, "export.json")
+        missing_path = os.path.join(temp_dir, "missing.json")
+        with open(export_path, "w") as f:
+            f.write("{}")
+
+        command = self._run_download(
+            f"https://t.me/channel/123\n\n   {export_path}  \n{missing_path}\n",
+            temp_dir,
+        )
+
+        self.assertEqual(
+            command,
+            [
+                "download",
+                "-u", "https://t.me/channel/123",
+                "-f", export_path,
+                "-u", missing_path,
+                "-d", temp_dir,
+            ],
+        )
+
+    def test_empty_source_input_does_not_run(self):
+        self.mock_tdl_runner.is_running.return_value = False
+        self.tab.source_input.setPlainText(" \n\n")
+        self.tab.handle_download_button()
+        self.mock_tdl_runner.run.assert_not_called()
+
+    def test_advanced_settings_dialog_is_reused(self):
+        with patch("src.download_tab.AdvancedSettingsDialog") as dialog_class:
+            dialog_class.return_value.exec.return_value = 1
+            dialog_class.return_value.get_settings.return_value = {"threads": 8}
+            self.tab.open_advanced_settings_dialog()
+            self.tab.open_advanced_settings_dialog()
+
+        dialog_class.assert_called_once_with(self.tab)
+        self.assertEqual(self.tab.advanced_settings, {"threads": 8})
+
+    def test_existing_paths(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        present = os.path.join(temp_dir, "a.json")
+        open(present, "w").close()
+        absent = os.path.join(temp_dir, "b.json")
+        in_missing_dir = os.path.join(temp_dir, "nope", "c.json")
+        paths = [present, absent, in_missing_dir]
+        expected = {present}
+        if hasattr(os, "symlink"):
+            linked = os.path.join(temp_dir, "linked.json")
+            os.symlink(present, linked)
+            dangling = os.path.join(temp_dir, "dangling.json")
+            os.symlink(absent, dangling)
+            paths += [linked, dangling]
+            expected.add(linked)
+
+        # Checked path by path, then with one directory listing
+        self.assertEqual(_existing_paths(paths), expected)
+        with patch("src.download_tab._SCANDIR_MIN_PATHS", 1):
+            self.assertEqual(_existing_paths(paths), expected)
+
+    def test_deleted_destination_is_created_again(self):
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        dest_path = os.path.join(temp_dir, "out")
+
+        self._run_download("https://t.me/channel/1", dest_path)
+        self.assertTrue(os.path.isdir(dest_path))
+        os.rmdir(dest_path)
+        self._run_download("https://t.me/channel/1", dest_path)
+        self.assertTrue(os.path.isdir(dest_path))
+
+    def test_crlf_source_file_loads_without_blank_lines(self):
+        """A CRLF file split into many slices gives the same lines as setPlainText."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        filepath = os.path.join(temp_dir, "sources.txt")
+        lines = [f"https://t.me/channel/{i}" for i in range(20)]
+        with open(filepath, "wb") as f:
+            f.write("\r\n".join(lines).encode("utf-8"))
+
+        signals = MagicMock()
+        _FileLoadRunnable(filepath, signals).run()
+        loaded_path, text = signals.loaded.emit.call_args[0]
+        self.assertEqual(loaded_path, filepath)
+        self.assertNotIn("\r", text)
+
+        with patch("src.download_tab._LOAD_CHUNK_SIZE", 8):
+            self.tab._on_source_file_loaded(filepath, text)
+            # Loading is still in progress: inputs are locked, Start refuses
+            self.assertFalse(self.tab.source_input.isEnabled())
+            self.assertFalse(self.tab.load_from_file_button.isEnabled())
+            self.mock_tdl_runner.is_running.return_value = False
+            self.tab.handle_download_button()
+            self.mock_tdl_runner.run.assert_not_called()
+
+            while self.tab._loading_sources:
+                app.processEvents()
+
+        self.assertTrue(self.tab.source_input.isEnabled())
+        self.assertEqual(self.tab.source_input.toPlainText().split("\n"), lines)
+
 if __name__ == '__main__':
     unittest.main()
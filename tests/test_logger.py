@@ -0,0 +1,138 @@
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add src to path to allow importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication
+app = QApplication.instance()
+if app is None:
+    app = QApplication(sys.argv)
+
+from src.logger import BufferedFileHandler, Logger, _PassThroughQueueHandler
+
+class TestBufferedFileHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.log_path = os.path.join(self.temp_dir, "app.log")
+        self.handler = BufferedFileHandler(self.log_path, encoding="utf-8")
+        self.addCleanup(self.handler.close)
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+    def _emit(self, level, msg):
+        self.handler.emit(logging.LogRecord("test", level, __file__, 0, msg, None, None))
+
+    def _read_log(self):
+        with open(self.log_path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_debug_stays_buffered_until_close(self):
+        self._emit(logging.DEBUG, "first")
+        self._emit(logging.DEBUG, "second")
+        self.assertEqual(self._read_log(), "")
+
+        self.handler.close()
+        self.assertEqual(self._read_log(), "DEBUG first\nDEBUG second\n")
+
+    def test_info_flushes_everything_buffered(self):
+        self._emit(logging.DEBUG, "before")
+        self._emit(logging.INFO, "done")
+        self.assertEqual(self._read_log(), "DEBUG before\nINFO done\n")
+
+    def test_flushes_once_the_interval_has_passed(self):
+        with patch("src.logger.time.monotonic", return_value=0.0):
+            handler = BufferedFileHandler(self.log_path, encoding="utf-8")
+        self.addCleanup(handler.close)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        record = logging.LogRecord("test", logging.DEBUG, __file__, 0, "late", None, None)
+        with patch("src.logger.time.monotonic", return_value=5.0):
+            handler.emit(record)
+        self.assertEqual(self._read_log(), "late\n")
+
+class _ThreadRecordingArg:
+    """A log argument that notes which thread turns it into text."""
+
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread())
+        return "recorded"
+
+class TestLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        settings_manager = MagicMock()
+        settings_manager.config_dir = self.temp_dir
+        settings_manager.get.return_value = False
+        self.logger = Logger(settings_manager)
+        self.addCleanup(self._close_logger)
+        # Leave only this Logger's handler on the shared "tdl-gui" logger, so
+        # capture handlers added by the test runner do not format records
+        logging_logger = self.logger.logger
+        foreign = [
+            handler
+            for handler in logging_logger.handlers
+            if not isinstance(handler, _PassThroughQueueHandler)
+        ]
+        for handler in foreign:
+            logging_logger.removeHandler(handler)
+            self.addCleanup(logging_logger.addHandler, handler)
+
+    def _close_logger(self):
+        self.logger.shutdown()
+        logging_logger = self.logger.logger
+        for handler in list(logging_logger.handlers):
+            if isinstance(handler, _PassThroughQueueHandler):
+                logging_logger.removeHandler(handler)
+        logging_logger.removeHandler(self.logger._file_handler)
+        self.logger._file_handler.close()
+
+    def test_records_are_formatted_on_the_listener_thread(self):
+        arg = _ThreadRecordingArg()
+        self.logger.info("value: %s", arg)
+        self.logger.shutdown()
+
+        self.assertTrue(arg.threads)
+        self.assertNotIn(threading.main_thread(), arg.threads)
+        with open(os.path.join(self.temp_dir, "app.log"), encoding="utf-8") as f:
+            self.assertIn("INFO - value: recorded", f.read())
+
+    def test_records_after_shutdown_still_reach_the_file(self):
+        self.logger.info("before")
+        self.logger.shutdown()
+        self.logger.info("after")
+        self.logger._file_handler.flush()
+
+        with open(os.path.join(self.temp_dir, "app.log"), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines[0].endswith("INFO - before"))
+        self.assertTrue(lines[1].endswith("INFO - after"))
+
+    def test_batch_timer_only_runs_while_records_are_pending(self):
+        batches = []
+        self.logger.log_batch_signal.connect(batches.append)
+        app.processEvents()
+        self.assertFalse(self.logger._batch_timer.isActive())
+
+        self.logger.info("one")
+        self.logger.info("two")
+        while not batches:
+            app.processEvents()
+
+        self.assertEqual([level for _msg, level in batches[0]], ["INFO", "INFO"])
+        self.assertTrue(batches[0][1][0].endswith("INFO - two"))
+        self.assertFalse(self.logger._batch_timer.isActive())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+# Add src to path to allow importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication
+app = QApplication.instance()
+if app is None:
+    app = QApplication(sys.argv)
+
+from src.login_worker import LoginWorker
+
+class FakePty:
+    """Hands out the given chunks from read(), then reports EOF."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def isalive(self):
+        return bool(self.chunks)
+
+    def read(self, size):
+        if not self.chunks:
+            raise EOFError
+        return self.chunks.pop(0)
+
+class TestLoginWorkerOutputParsing(unittest.TestCase):
+
+    def setUp(self):
+        settings_manager = MagicMock()
+        settings_manager.get.return_value = False
+        self.worker = LoginWorker("tdl", "default", settings_manager, MagicMock())
+        self.events = []
+        self.worker.prompt_for_input.connect(
+            lambda prompt_type, text: self.events.append(("prompt", prompt_type, text))
+        )
+        self.worker.warning_detected.connect(
+            lambda message: self.events.append(("warning", message))
+        )
+        self.worker.status_update.connect(
+            lambda message: self.events.append(("status", message))
+        )
+        self.worker.login_success.connect(lambda: self.events.append(("success",)))
+        self.worker.qr_code_ready.connect(
+            lambda text: self.events.append(("qr", text))
+        )
+
+    def _read(self, chunks, qr=False):
+        self.worker.pty_process = FakePty(chunks)
+        if qr:
+            self.worker._read_pty_output_for_qr()
+        else:
+            self.worker._read_pty_output()
+        return self.events
+
+    def test_prompt_split_across_reads(self):
+        events = self._read(["\x1b[1mWARN: x \x1b[0m? Enter your pho", "ne number: "])
+        self.assertEqual(
+            events,
+            [("warning", "WARN: x"), ("prompt", "phone", "Enter your phone number")],
+        )
+
+    def test_code_prompt_then_success(self):
+        events = self._read(
+            ["Sending code...\n? Enter ", "code: ", "\r\nLogin succ", "essfully!\nmore\n"]
+        )
+        self.assertEqual(
+            events,
+            [
+                ("status", "Sending verification code..."),
+                ("prompt", "code", "Enter code"),
+                ("success",),
+            ],
+        )
+        self.assertTrue(self.worker._login_success_emitted)
+
+    def test_password_prompt(self):
+        events = self._read(["? Enter password: ", ""])
+        self.assertEqual(events, [("prompt", "password", "Enter password")])
+
+    def test_qr_code_emitted_once_trigger_is_seen(self):
+        """The trigger may be split across reads; output before it is kept."""
+        events = self._read(["banner\n", "abc Scan QR", " code\n####", "##"], qr=True)
+        self.assertEqual(
+            events,
+            [
+                ("qr", "banner\nabc Scan QR code\n####"),
+                ("qr", "banner\nabc Scan QR code\n######"),
+            ],
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import sys
+import unittest
+
+# Add src to path to allow importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPalette
+from PyQt6.QtWidgets import QApplication, QStyleOptionViewItem
+app = QApplication.instance()
+if app is None:
+    app = QApplication(sys.argv)
+
+from src.progress_widget import DownloadProgressDelegate, DownloadProgressModel
+
+class TestDownloadProgressModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = DownloadProgressModel()
+
+    def _ids(self):
+        return [
+            self.model.data(self.model.index(row), Qt.ItemDataRole.DisplayRole)
+            for row in range(self.model.rowCount())
+        ]
+
+    def _progress(self, row):
+        return self.model.data(self.model.index(row), DownloadProgressModel.ProgressRole)
+
+    def test_newest_download_is_first(self):
+        for file_id in ("a", "b", "c"):
+            self.model.add(file_id)
+        self.model.add("b")  # Adding a known ID again is a no-op
+        self.assertEqual(self._ids(), ["c", "b", "a"])
+        self.assertIsNone(self._progress(0))
+
+    def test_update_adds_unknown_download(self):
+        self.model.update("a", {"id": "a", "percent": "5%"})
+        self.assertEqual(self._ids(), ["a"])
+        self.assertEqual(self._progress(0), {"id": "a", "percent": "5%"})
+
+    def test_update_after_remove_targets_the_right_row(self):
+        for file_id in ("a", "b", "c", "d"):
+            self.model.add(file_id)
+        self.model.remove("b")
+        self.model.remove("missing")  # Unknown IDs are ignored
+        self.assertEqual(self._ids(), ["d", "c", "a"])
+
+        changed = []
+        self.model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: changed.append(top_left.row())
+        )
+        self.model.update("c", {"id": "c", "percent": "50%"})
+        self.model.update("a", {"id": "a", "percent": "10%"})
+
+        self.assertEqual(changed, [1, 2])
+        self.assertEqual(self._progress(1), {"id": "c", "percent": "50%"})
+        self.assertEqual(self._progress(2), {"id": "a", "percent": "10%"})
+        self.assertIsNone(self._progress(0))
+
+    def test_clear(self):
+        self.model.add("a")
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertNotIn("a", self.model)
+
+class TestDownloadProgressDelegate(unittest.TestCase):
+
+    def test_border_follows_the_palette(self):
+        model = DownloadProgressModel()
+        model.add("a")
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Mid, QColor("#123456"))
+        option = QStyleOptionViewItem()
+        option.rect = QRect(0, 0, 200, 60)
+        option.palette = palette
+
+        image = QImage(200, 60, QImage.Format.Format_ARGB32)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        DownloadProgressDelegate().paint(painter, option, model.index(0))
+        painter.end()
+
+        # Middle of the frame's left edge
+        self.assertEqual(image.pixelColor(0, 28).name(), "#123456")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import shutil
+import unittest
+
+# Add src to path to allow importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.theme_manager import ThemeManager, _minify_qss
+
+SAMPLE_QSS = """
+/* Base */
+QWidget {
+    font-family: "Segoe UI", Arial;
+    color : #333 ;
+}
+
+QLabel#Title , QPushButton:hover {
+    qproperty-text: "a : b ,  c";
+    image: url( icons/my arrow.png );
+}
+
+/* Not drawn in the first paint */
+QTableView::item {
+    padding: 4px;
+}
+"""
+
+class TestMinifyQss(unittest.TestCase):
+
+    def test_strips_comments_and_whitespace(self):
+        self.assertEqual(
+            _minify_qss("/* c */ QWidget {\n  color : red ;\n}\n\n/* d */"),
+            "QWidget{color:red;}",
+        )
+
+    def test_keeps_strings_and_urls_intact(self):
+        minified = _minify_qss(SAMPLE_QSS)
+        self.assertIn('font-family:"Segoe UI",Arial;', minified)
+        self.assertIn('qproperty-text:"a : b ,  c";', minified)
+        self.assertIn("image:url( icons/my arrow.png );", minified)
+
+    def test_comment_markers_inside_strings_are_kept(self):
+        self.assertEqual(
+            _minify_qss('QLabel { qproperty-text: "/* not a comment */"; }'),
+            'QLabel{qproperty-text:"/* not a comment */";}',
+        )
+
+class TestThemeManager(unittest.TestCase):
+
+    def setUp(self):
+        self.styles_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.styles_dir)
+        self.qss_path = os.path.join(self.styles_dir, "sample.qss")
+        with open(self.qss_path, "w", encoding="utf-8") as f:
+            f.write(SAMPLE_QSS)
+        self.manager = ThemeManager(self.styles_dir)
+
+    def test_discovers_themes(self):
+        self.assertEqual(self.manager.get_theme_names(), ["sample"])
+        self.assertEqual(self.manager.get_stylesheet("missing"), "")
+
+    def test_critical_stylesheet_keeps_first_paint_rules_in_order(self):
+        critical = self.manager.get_critical_stylesheet("sample")
+        self.assertEqual(
+            critical,
+            'QWidget{font-family:"Segoe UI",Arial;color:#333;}'
+            'QLabel#Title,QPushButton:hover{qproperty-text:"a : b ,  c";'
+            "image:url( icons/my arrow.png );}",
+        )
+        self.assertNotIn("QTableView", critical)
+
+    def test_stylesheet_reloads_after_file_changes(self):
+        self.assertIn("QWidget", self.manager.get_stylesheet("sample"))
+        with open(self.qss_path, "w", encoding="utf-8") as f:
+            f.write("QFrame { border: none; }")
+        stat = os.stat(self.qss_path)
+        os.utime(self.qss_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self.manager.get_stylesheet("sample"), "QFrame{border:none;}")
+
+if __name__ == '__main__':
+    unittest.main()
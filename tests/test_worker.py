@@ -0,0 +1,50 @@
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add src to path to allow importing
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.worker
+from src.worker import parse_chat_rows
+
+CHATS_JSON = json.dumps(
+    [
+        {"id": 1001, "type": "private", "visible_name": "Alice", "username": "alice"},
+        {"id": 2002, "type": "channel", "visible_name": "News"},
+        {"type": "group"},
+    ]
+)
+EXPECTED_ROWS = [
+    ("Alice", "private", "1001", "alice"),
+    ("News", "channel", "2002", ""),
+    ("", "group", "", ""),
+]
+
+class TestParseChatRows(unittest.TestCase):
+
+    def test_parse_with_stdlib_json(self):
+        with patch.object(src.worker, "orjson", None):
+            self.assertEqual(parse_chat_rows(CHATS_JSON), EXPECTED_ROWS)
+
+    @unittest.skipIf(src.worker.orjson is None, "orjson is not installed")
+    def test_parse_with_orjson(self):
+        self.assertEqual(parse_chat_rows(CHATS_JSON), EXPECTED_ROWS)
+        self.assertEqual(parse_chat_rows(CHATS_JSON.encode("utf-8")), EXPECTED_ROWS)
+
+    def test_chat_types_are_shared_strings(self):
+        rows = parse_chat_rows(json.dumps([{"type": "private"}, {"type": "private"}]))
+        self.assertIs(rows[0][1], rows[1][1])
+
+    def test_malformed_input_raises_json_error(self):
+        with patch.object(src.worker, "orjson", None):
+            with self.assertRaises(json.JSONDecodeError):
+                parse_chat_rows("[{")
+        if src.worker.orjson is not None:
+            with self.assertRaises(json.JSONDecodeError):
+                parse_chat_rows("[{")
+
+if __name__ == '__main__':
+    unittest.main()